@@ -0,0 +1,84 @@
+"""numpy helpers shared by the vectorized solutions.
+
+Numbers are parsed straight from the raw bytes of an input in one pass, with
+a "-" right before the digits as a sign, and variable-length rows (reports,
+updates) are packed into one ragged array: values holds every row back to
+back and row r is values[offsets[r] : offsets[r + 1]].
+
+numpy is optional: without it NUMPY_AVAILABLE is False, np is None and the
+solutions use their list versions.
+"""
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+ZERO = ord("0")
+NINE = ord("9")
+NEWLINE = ord("\n")
+MINUS = ord("-")
+MAX_DIGITS = 18  # longest digit run that always fits in an int64
+
+
+def _numbers_with_starts(buffer):
+    """(values, start byte of the digits of each) for every integer in buffer."""
+    is_digit = (buffer >= ZERO) & (buffer <= NINE)
+    positions = np.flatnonzero(is_digit)
+    if not len(positions):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    # A number starts at a digit whose previous byte is not a digit
+    edges = np.diff(is_digit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if (ends - starts).max() > MAX_DIGITS:
+        raise ValueError(f"numbers of more than {MAX_DIGITS} digits overflow int64")
+
+    # Weight each digit by 10 ** (digits remaining after it in its number)
+    number = np.cumsum(edges[positions] == 1) - 1
+    exponent = ends[number] - positions - 1
+    digits = (buffer[positions] - ZERO).astype(np.int64)
+    weighted = digits * np.power(10, exponent, dtype=np.int64)
+    values = np.add.reduceat(weighted, np.searchsorted(positions, starts))
+
+    # A "-" right before the digits is the number's sign
+    before = starts[starts > 0] - 1
+    negative = np.zeros(len(starts), dtype=bool)
+    negative[starts > 0] = buffer[before] == MINUS
+    values[negative] *= -1
+    return values, starts
+
+
+def parse_numbers(data: bytes):
+    """Every integer in data, in order, as an int64 array."""
+    return _numbers_with_starts(np.frombuffer(data, dtype=np.uint8))[0]
+
+
+def parse_rows(data: bytes):
+    """The integers of each line of data as (values, offsets) arrays."""
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buffer == NEWLINE)
+    line_count = len(newlines) + (1 if len(buffer) and buffer[-1] != NEWLINE else 0)
+    values, starts = _numbers_with_starts(buffer)
+
+    # Number i belongs to the line with as many newlines before it
+    line_of_number = np.searchsorted(newlines, starts)
+    offsets = np.searchsorted(line_of_number, np.arange(line_count + 1))
+    return values, offsets.astype(np.int64)
+
+
+def pack_rows(rows):
+    """Pack a list of int lists into (values, offsets) arrays."""
+    lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    values = np.fromiter(
+        (value for row in rows for value in row),
+        dtype=np.int64,
+        count=int(offsets[-1]),
+    )
+    return values, offsets
@@ -0,0 +1,248 @@
+"""Benchmark the hot function of every day on synthetic inputs of growing size.
+
+Usage (from the repository root):
+
+    python -m aoc.bench
+    python -m aoc.bench --days 4 6 20 --scales 1 10 100 --budget 30
+    python -m aoc.bench --csv bench_output.txt
+
+For every benchmark the input is generated at each scale from a fixed seed,
+parsed outside the timed region, and then the named function is timed. The
+report shows the growth exponent between consecutive scales: ~1 means the
+function is linear in input size, ~2 quadratic, and so on.
+"""
+
+import argparse
+import csv
+import math
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+from aoc.inputs import DEFAULT_SEED, generate
+from aoc.runner import discover_solutions, load_solution
+
+DEFAULT_SCALES = (1, 10, 100)
+
+
+@dataclass
+class Benchmark:
+    """A function to time and how to build its arguments from an input file."""
+
+    day: int
+    part: int
+    function: str
+    setup: Callable[[Any, str], Tuple]
+
+
+@dataclass
+class Sample:
+    """One timed call of a benchmark at one scale."""
+
+    benchmark: Benchmark
+    scale: float
+    input_bytes: int
+    seconds: float
+
+
+def _grid_size(coordinates):
+    return max(max(x, y) for x, y in coordinates) + 1
+
+
+def _fallen_grid(module, path):
+    # The real input drops 1024 of ~3450 bytes, so keep the same proportion
+    coordinates = module.parse_input(path)
+    fallen = coordinates[: len(coordinates) * 3 // 10]
+    return (module.create_grid(fallen, _grid_size(coordinates)),)
+
+
+def _disk_blocks(module, path):
+    return module.create_block_representation(
+        module.parse_disk_map(module.read_input(path))
+    )
+
+
+BENCHMARKS = [
+    Benchmark(1, 1, "calculate_total_distance", lambda m, p: m.read_input(p)),
+    Benchmark(1, 1, "total_distance", lambda m, p: m.read_columns(p)),
+    Benchmark(1, 1, "external_total_distance", lambda m, p: (p,)),
+    Benchmark(1, 2, "calculate_similarity_score", lambda m, p: m.read_input(p)),
+    Benchmark(1, 2, "similarity_score", lambda m, p: m.read_columns(p)),
+    Benchmark(1, 2, "streaming_similarity_score", lambda m, p: (p,)),
+    Benchmark(2, 1, "count_safe_reports", lambda m, p: (m.read_input(p),)),
+    Benchmark(2, 1, "count_safe", lambda m, p: m.read_reports(p)),
+    Benchmark(
+        2, 2, "count_safe_reports_with_dampener", lambda m, p: (m.read_input(p),)
+    ),
+    Benchmark(2, 2, "count_safe_with_dampener", lambda m, p: m.read_reports(p)),
+    Benchmark(2, 2, "count_safe_streaming", lambda m, p: (p,)),
+    Benchmark(3, 1, "find_valid_multiplications", lambda m, p: (m.read_input(p),)),
+    # find_valid_multiplications is a generator, so time consuming it
+    Benchmark(
+        3,
+        2,
+        "calculate_total",
+        lambda m, p: (m.find_valid_multiplications(m.read_input(p)),),
+    ),
+    Benchmark(3, 2, "sum_file", lambda m, p: (p,)),
+    Benchmark(3, 2, "sum_file_sharded", lambda m, p: (p,)),
+    Benchmark(4, 1, "count_word_occurrences", lambda m, p: (m.read_input(p), "XMAS")),
+    Benchmark(4, 2, "count_xmas_patterns", lambda m, p: (m.read_input(p),)),
+    Benchmark(4, 2, "count_xmas", lambda m, p: (m.grid_array(m.read_input(p)),)),
+    Benchmark(5, 1, "solve", lambda m, p: (p,)),
+    Benchmark(5, 1, "valid_middle_sum", lambda m, p: m.read_input(p)),
+    Benchmark(5, 2, "solve", lambda m, p: (p,)),
+    Benchmark(6, 1, "simulate_guard_path", lambda m, p: (m.read_input(p),)),
+    Benchmark(6, 2, "find_loop_positions", lambda m, p: (m.read_input(p),)),
+    Benchmark(7, 1, "calculate_total_calibration", lambda m, p: (m.read_input(p),)),
+    Benchmark(7, 2, "calculate_total_calibration", lambda m, p: (m.read_input(p),)),
+    Benchmark(8, 1, "find_all_antinodes", lambda m, p: (m.read_input(p),)),
+    Benchmark(8, 2, "find_all_antinodes", lambda m, p: (m.read_input(p),)),
+    Benchmark(9, 1, "compact_files_optimized", lambda m, p: (_disk_blocks(m, p),)),
+    Benchmark(9, 2, "compact_files_optimized", _disk_blocks),
+    Benchmark(10, 1, "calculate_total_score", lambda m, p: (m.read_input(p),)),
+    Benchmark(10, 2, "calculate_total_rating", lambda m, p: (m.read_input(p),)),
+    Benchmark(11, 1, "simulate_blinks", lambda m, p: (m.read_input(p), 25)),
+    Benchmark(11, 2, "simulate_blinks_fast", lambda m, p: (m.read_input(p), 75, False)),
+    Benchmark(12, 1, "calculate_total_price", lambda m, p: (m.read_input(p),)),
+    Benchmark(13, 1, "solve", lambda m, p: (p,)),
+    Benchmark(13, 2, "solve", lambda m, p: (p,)),
+    Benchmark(14, 1, "solve", lambda m, p: (p,)),
+    Benchmark(
+        14, 2, "is_christmas_tree_pattern", lambda m, p: (m.parse_input(p), 101, 103)
+    ),
+    Benchmark(15, 1, "solve", lambda m, p: (p,)),
+    Benchmark(16, 1, "find_shortest_path", lambda m, p: (m.parse_input(p),)),
+    Benchmark(16, 2, "find_best_path_tiles", lambda m, p: (m.parse_input(p),)),
+    Benchmark(17, 1, "run_program", lambda m, p: (p,)),
+    Benchmark(17, 2, "simulate_program", lambda m, p: m.read_input(p)),
+    Benchmark(18, 1, "find_shortest_path", _fallen_grid),
+    Benchmark(
+        18,
+        2,
+        "find_blocking_coordinate",
+        lambda m, p: (m.parse_input(p), _grid_size(m.parse_input(p))),
+    ),
+    Benchmark(19, 1, "solve_part1", lambda m, p: (p,)),
+    Benchmark(19, 2, "solve_part2", lambda m, p: (p,)),
+    Benchmark(20, 1, "find_cheats", lambda m, p: m.parse_input(p)),
+    Benchmark(20, 2, "find_cheats", lambda m, p: m.parse_input(p)),
+]
+
+
+def time_benchmark(benchmark: Benchmark, module, input_path: str) -> float:
+    """Build the arguments from input_path and time one call of the function."""
+    function = getattr(module, benchmark.function)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        args = benchmark.setup(module, input_path)
+        start = time.perf_counter()
+        function(*args)
+        return time.perf_counter() - start
+
+
+def run_benchmarks(
+    days: Optional[List[int]] = None,
+    scales=DEFAULT_SCALES,
+    seed: int = DEFAULT_SEED,
+    budget: float = 60.0,
+    workdir: Optional[str] = None,
+) -> List[Sample]:
+    """Run the selected benchmarks at each scale.
+
+    A benchmark stops growing once a single call takes longer than budget
+    seconds, since the next scale would take at least ten times longer.
+    """
+    paths = {(day, part): path for day, part, path in discover_solutions()}
+    samples = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = workdir or tmp
+        os.makedirs(workdir, exist_ok=True)
+        modules = {}
+
+        for benchmark in BENCHMARKS:
+            key = (benchmark.day, benchmark.part)
+            if (days and benchmark.day not in days) or key not in paths:
+                continue
+            if key not in modules:
+                modules[key] = load_solution(*key, paths[key])
+
+            for scale in scales:
+                input_path = os.path.join(workdir, f"day{benchmark.day}_x{scale}.txt")
+                if not os.path.exists(input_path):
+                    with open(input_path, "w") as f:
+                        f.write(generate(benchmark.day, scale, seed))
+
+                seconds = time_benchmark(benchmark, modules[key], input_path)
+                sample = Sample(benchmark, scale, os.path.getsize(input_path), seconds)
+                samples.append(sample)
+                print(format_sample(sample, samples))
+                if seconds > budget:
+                    break
+
+    return samples
+
+
+def growth_exponent(smaller: Sample, larger: Sample) -> Optional[float]:
+    """Slope of log(time) against log(input size) between two samples."""
+    if smaller.seconds <= 0 or larger.input_bytes == smaller.input_bytes:
+        return None
+    return math.log(larger.seconds / smaller.seconds) / math.log(
+        larger.input_bytes / smaller.input_bytes
+    )
+
+
+def format_sample(sample: Sample, samples: List[Sample]) -> str:
+    """Format a sample, with its growth exponent against the previous scale."""
+    previous = [
+        s for s in samples if s.benchmark is sample.benchmark and s.scale < sample.scale
+    ]
+    exponent = growth_exponent(previous[-1], sample) if previous else None
+    growth = f"n^{exponent:.2f}" if exponent is not None else ""
+    b = sample.benchmark
+    return (
+        f"day{b.day:<3} part{b.part}  {b.function:<34} x{sample.scale:<5} "
+        f"{sample.input_bytes:>11} B  {sample.seconds:>10.4f}s  {growth}"
+    )
+
+
+def write_csv(samples: List[Sample], path: str):
+    """Write the timing curves as CSV."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["day", "part", "function", "scale", "input_bytes", "seconds"])
+        for s in samples:
+            b = s.benchmark
+            writer.writerow(
+                [b.day, b.part, b.function, s.scale, s.input_bytes, s.seconds]
+            )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark solutions at scale")
+    parser.add_argument("--days", type=int, nargs="+", help="Days to run (default all)")
+    parser.add_argument("--scales", type=float, nargs="+", default=list(DEFAULT_SCALES))
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=60.0,
+        help="Skip larger scales once one call exceeds this many seconds",
+    )
+    parser.add_argument("--keep", help="Directory to keep the generated inputs in")
+    parser.add_argument("--csv", help="Write the timing curves to this CSV file")
+    args = parser.parse_args(argv)
+
+    scales = [int(s) if s.is_integer() else s for s in sorted(args.scales)]
+    samples = run_benchmarks(args.days, scales, args.seed, args.budget, args.keep)
+    if args.csv:
+        write_csv(samples, args.csv)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
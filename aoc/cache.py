@@ -0,0 +1,189 @@
+"""Content-addressed on-disk cache of solution answers.
+
+An entry is keyed on the SHA-256 of:
+
+- the input file's bytes
+- the source of the solution file and of every local module it imports
+  (sibling files in its day directory and the aoc package), followed
+  transitively
+- the part number and any extra parameters
+
+so editing either the input or the code produces a new key and the old
+entry is simply never looked up again. Entries are pickled answers, one file
+per key. Reading an entry bumps its modification time, and storing one
+evicts the least recently used entries until the directory fits under the
+size cap.
+"""
+
+import ast
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENV_VAR = "AOC_CACHE_DIR"
+DEFAULT_DIR = os.path.join(ROOT, ".aoc_cache")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+SUFFIX = ".pkl"
+
+_MISSING = object()
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _local_imports(path: str, root: str) -> Iterable[str]:
+    """Paths of the modules imported by path that live in its directory or root."""
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), path)
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+            # "from aoc import grid" imports a module, not a name
+            names.extend(f"{node.module}.{alias.name}" for alias in node.names)
+
+    for name in names:
+        relative = name.replace(".", os.sep)
+        for base in (os.path.dirname(path), root):
+            for candidate in (
+                os.path.join(base, relative + ".py"),
+                os.path.join(base, relative, "__init__.py"),
+            ):
+                if os.path.isfile(candidate):
+                    yield os.path.abspath(candidate)
+
+
+def source_digest(path: str, root: str = ROOT) -> str:
+    """SHA-256 over a solution file and every local module it pulls in."""
+    seen = set()
+    pending = [os.path.abspath(path)]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        pending.extend(_local_imports(current, root))
+
+    digest = hashlib.sha256()
+    for source in sorted(seen):
+        digest.update(os.path.relpath(source, root).encode())
+        digest.update(b"\0")
+        digest.update(file_digest(source).encode())
+    return digest.hexdigest()
+
+
+def make_key(
+    input_path: str,
+    source_path: str,
+    part: int,
+    params: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Cache key for running source_path's part on input_path with params."""
+    digest = hashlib.sha256()
+    for field in (
+        file_digest(input_path),
+        source_digest(source_path),
+        str(part),
+        repr(sorted((params or {}).items())),
+    ):
+        digest.update(field.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Answers stored as one pickle file per key, with LRU eviction by size."""
+
+    def __init__(
+        self, directory: str = DEFAULT_DIR, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Stored answer for key, or default. A hit marks the entry as used."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                answer = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self.misses += 1
+            return default
+        os.utime(path)
+        self.hits += 1
+        return answer
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """(found, answer) for key, telling a cached None apart from a miss."""
+        answer = self.get(key, _MISSING)
+        return (False, None) if answer is _MISSING else (True, answer)
+
+    def put(self, key: str, answer: Any):
+        """Store answer under key, then evict old entries over the size cap."""
+        # Write to a temporary file first so concurrent readers never see a
+        # half-written entry
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(answer, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.evict()
+
+    def entries(self):
+        """(mtime, size, path) of every entry, least recently used first."""
+        found = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:  # evicted by another process
+                        continue
+                    found.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(found)
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Remove every entry."""
+        for _, _, path in self.entries():
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+
+def directory_from_env() -> Optional[str]:
+    """Cache directory requested through AOC_CACHE_DIR, if any."""
+    return os.environ.get(ENV_VAR) or None
@@ -0,0 +1,149 @@
+"""Flat, memory-mapped view of a rectangular text grid.
+
+Cell (x, y) lives at index y * stride + x of a single byte buffer. Rows keep
+their trailing newline, so stride is width + 1 and the newline column acts
+as a sentinel: stepping right off a row lands on b"\\n" instead of wrapping
+onto the next row, and stepping left off a row lands on the previous row's
+newline. Together with a range check on the index that makes every bounds
+test a single comparison against the buffer. With CRLF line endings each
+\\r is turned into a second newline column, so stride is width + 2.
+
+Grids read from files hold a memory mapping; use them as context managers
+(or call close()) to release it.
+"""
+
+import mmap
+from typing import Iterator, List, Tuple
+
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+
+
+class Grid:
+    """A text grid stored as one contiguous buffer with precomputed offsets."""
+
+    def __init__(self, data, width: int, height: int, stride: int):
+        self.data = data
+        self.width = width
+        self.height = height
+        self.stride = stride
+        self.size = len(data)
+
+        # Neighbor offsets, clockwise starting from up
+        self.up, self.right, self.down, self.left = -stride, 1, stride, -1
+        self.orthogonal = (self.up, self.right, self.down, self.left)
+        self.diagonal = (-stride + 1, stride + 1, stride - 1, -stride - 1)
+        self.all_directions = (
+            self.up,
+            -stride + 1,
+            self.right,
+            stride + 1,
+            self.down,
+            stride - 1,
+            self.left,
+            -stride - 1,
+        )
+
+    @classmethod
+    def from_buffer(cls, data) -> "Grid":
+        """Wrap a newline separated buffer, without copying it unless it is CRLF."""
+        width = data.find(b"\n")
+        line_break = 1
+        if width > 0 and data[width - 1] == CARRIAGE_RETURN:
+            # Copy with every \r as a second sentinel newline
+            data = bytearray(data).replace(b"\r", b"\n")
+            width -= 1
+            line_break = 2
+
+        end = len(data)
+        while end and data[end - 1] == NEWLINE:
+            end -= 1
+        if width == -1 or width >= end:
+            width = end
+        stride = width + line_break
+        height = (end + stride - 1) // stride if end else 0
+        return cls(data, width, height, stride)
+
+    @classmethod
+    def from_file(cls, filename: str, writable: bool = False) -> "Grid":
+        """Memory-map a grid file.
+
+        With writable=True the mapping is copy-on-write, so cells can be
+        changed without touching the file on disk.
+        """
+        with open(filename, "rb") as f:
+            try:
+                access = mmap.ACCESS_COPY if writable else mmap.ACCESS_READ
+                data = mmap.mmap(f.fileno(), 0, access=access)
+            except ValueError:  # empty file, which mmap refuses
+                data = bytearray()
+        grid = cls.from_buffer(data)
+        if grid.data is not data:  # CRLF input was copied
+            data.close()
+        return grid
+
+    @classmethod
+    def blank(cls, width: int, height: int, fill: str = ".") -> "Grid":
+        """Build a writable width x height grid filled with one character."""
+        return cls.from_buffer(bytearray((fill * width + "\n") * height, "ascii"))
+
+    def index(self, x: int, y: int) -> int:
+        """Buffer index of cell (x, y)."""
+        return y * self.stride + x
+
+    def coords(self, i: int) -> Tuple[int, int]:
+        """(x, y) of buffer index i."""
+        y, x = divmod(i, self.stride)
+        return x, y
+
+    def __getitem__(self, i: int) -> int:
+        return self.data[i]
+
+    def __setitem__(self, i: int, value: int):
+        self.data[i] = value
+
+    def __len__(self) -> int:
+        return self.size
+
+    def find(self, char: str) -> int:
+        """Index of the first cell holding char, or -1."""
+        return self.data.find(char.encode())
+
+    def find_all(self, char: str) -> List[int]:
+        """Indices of every cell holding char."""
+        needle = char.encode()
+        found = []
+        i = self.data.find(needle)
+        while i != -1:
+            found.append(i)
+            i = self.data.find(needle, i + 1)
+        return found
+
+    def cells(self) -> Iterator[int]:
+        """Indices of every cell in row-major order."""
+        for row_start in range(0, self.height * self.stride, self.stride):
+            yield from range(row_start, row_start + self.width)
+
+    def neighbors(self, i: int) -> Iterator[int]:
+        """In-bounds orthogonal neighbors of i."""
+        data, size = self.data, self.size
+        for offset in self.orthogonal:
+            n = i + offset
+            if 0 <= n < size and data[n] != NEWLINE:
+                yield n
+
+    def row(self, y: int) -> bytes:
+        """Contents of row y."""
+        start = y * self.stride
+        return bytes(self.data[start : start + self.width])
+
+    def close(self):
+        """Release the memory mapping, if any."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self) -> "Grid":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
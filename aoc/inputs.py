@@ -0,0 +1,442 @@
+"""Seeded generators for synthetic puzzle inputs at arbitrary scale.
+
+Each generate_dayN(rng, scale) returns the text of a valid input for that
+day's format. Scale 1 is roughly the size of the real puzzle input and the
+amount of data grows linearly with scale: line-based inputs get scale times
+more lines, grids get scale times more cells.
+"""
+
+import math
+import random
+import string
+
+DEFAULT_SEED = 2024
+
+
+def _side(base: int, scale: float) -> int:
+    """Side length of a square grid holding scale times the cells of base x base."""
+    return max(3, int(round(base * math.sqrt(scale))))
+
+
+def _lines(base: int, scale: float) -> int:
+    return max(1, int(round(base * scale)))
+
+
+def _walled_grid(rng, width, height, wall_density):
+    """Grid of '.' surrounded by '#' with random interior walls."""
+    grid = [["#"] * width for _ in range(height)]
+    for y in range(1, height - 1):
+        for x in range(1, width - 1):
+            grid[y][x] = "#" if rng.random() < wall_density else "."
+    return grid
+
+
+def _maze(rng, size, extra_openings=0.0):
+    """Perfect maze on an odd size x size grid, optionally with loops knocked in."""
+    size = size if size % 2 else size + 1
+    grid = [["#"] * size for _ in range(size)]
+    stack = [(1, 1)]
+    grid[1][1] = "."
+    while stack:
+        x, y = stack[-1]
+        options = [
+            (dx, dy)
+            for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 < x + dx < size - 1
+            and 0 < y + dy < size - 1
+            and grid[y + dy][x + dx] == "#"
+        ]
+        if not options:
+            stack.pop()
+            continue
+        dx, dy = rng.choice(options)
+        grid[y + dy // 2][x + dx // 2] = "."
+        grid[y + dy][x + dx] = "."
+        stack.append((x + dx, y + dy))
+
+    for y in range(1, size - 1):
+        for x in range(1, size - 1):
+            if grid[y][x] == "#" and rng.random() < extra_openings:
+                grid[y][x] = "."
+    return grid
+
+
+def _join(grid):
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def generate_day1(rng, scale):
+    """Two columns of five digit location IDs."""
+    return "".join(
+        f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}\n"
+        for _ in range(_lines(1000, scale))
+    )
+
+
+def generate_day2(rng, scale):
+    """Reports of 5-8 levels that are mostly monotonic with occasional faults."""
+    lines = []
+    for _ in range(_lines(1000, scale)):
+        level = rng.randint(1, 99)
+        step = rng.choice((1, -1))
+        levels = [level]
+        for _ in range(rng.randint(4, 7)):
+            delta = rng.randint(1, 3) * step
+            if rng.random() < 0.08:
+                delta = rng.choice((0, -delta, delta * 3))
+            # Levels are positive: bounce off the floor instead of crossing it
+            if level + delta < 1:
+                delta = -delta
+            level += delta
+            levels.append(level)
+        lines.append(" ".join(map(str, levels)))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day3(rng, scale):
+    """Corrupted memory with mul/do/don't instructions mixed into noise."""
+    junk = "!@#$%^&*()[]{}<>,;:'?/~+- "
+    tokens = [
+        "what()",
+        "who()",
+        "how()",
+        "from()",
+        "select()",
+        "mul(",
+        "mul[3,4]",
+        "mul(4*",
+        "mul ( 2 , 4 )",
+    ]
+    parts = []
+    size = 0
+    target = _lines(20000, scale)
+    while size < target:
+        roll = rng.random()
+        if roll < 0.35:
+            token = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif roll < 0.39:
+            token = "do()"
+        elif roll < 0.43:
+            token = "don't()"
+        elif roll < 0.65:
+            token = rng.choice(tokens)
+        else:
+            token = "".join(rng.choice(junk) for _ in range(rng.randint(1, 4)))
+        parts.append(token)
+        size += len(token)
+    return "".join(parts) + "\n"
+
+
+def generate_day4(rng, scale):
+    """Word search grid over the letters of XMAS."""
+    side = _side(140, scale)
+    return "".join(
+        "".join(rng.choice("XMAS") for _ in range(side)) + "\n" for _ in range(side)
+    )
+
+
+def generate_day5(rng, scale):
+    """Page ordering rules from a hidden total order plus updates drawn from it."""
+    num_pages = _lines(49, scale)
+    order = rng.sample(range(10, 10 + num_pages * 2), num_pages)
+    rank = {page: i for i, page in enumerate(order)}
+
+    # Every page gets rules against the pages near it in the hidden order, so
+    # rule count grows linearly with scale and updates stay fully constrained.
+    window = 24
+    rules = []
+    for i, before in enumerate(order):
+        for after in order[i + 1 : i + 1 + window]:
+            rules.append(f"{before}|{after}")
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(_lines(200, scale)):
+        length = rng.choice(range(5, min(window, num_pages) + 1, 2))
+        start = rng.randint(0, num_pages - length)
+        pages = rng.sample(order[start : start + window], length)
+        if rng.random() < 0.5:
+            pages.sort(key=rank.get)
+        updates.append(",".join(map(str, pages)))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def _guard_spiral(rng, side):
+    """Start, obstacles and visited cells of a guard spiralling off the map.
+
+    Every leg ends a few cells beyond everything walked so far, where an
+    obstacle turns the guard right, so it never meets an earlier obstacle
+    again and walks off the map once the next leg would cross the edge.
+    """
+    x = rng.randrange(2 * side // 5, 3 * side // 5 + 1)
+    y = rng.randrange(2 * side // 5, 3 * side // 5 + 1)
+    start = (x, y)
+    dx, dy = 0, -1
+    min_x, max_x, min_y, max_y = x, x, y, y
+    obstacles = set()
+    visited = {start}
+    while True:
+        gap = rng.randint(2, 3)
+        if dy == -1:
+            stop_x, stop_y = x, min_y - gap
+        elif dx == 1:
+            stop_x, stop_y = max_x + gap, y
+        elif dy == 1:
+            stop_x, stop_y = x, max_y + gap
+        else:
+            stop_x, stop_y = min_x - gap, y
+        if not (0 <= stop_x + dx < side and 0 <= stop_y + dy < side):
+            break
+        while (x, y) != (stop_x, stop_y):
+            x, y = x + dx, y + dy
+            visited.add((x, y))
+        obstacles.add((x + dx, y + dy))
+        min_x, max_x = min(min_x, x), max(max_x, x)
+        min_y, max_y = min(min_y, y), max(max_y, y)
+        dx, dy = -dy, dx
+
+    while 0 <= x + dx < side and 0 <= y + dy < side:
+        x, y = x + dx, y + dy
+        visited.add((x, y))
+    return start, obstacles, visited
+
+
+def generate_day6(rng, scale):
+    """Lab map with scattered obstacles and the guard facing up.
+
+    Like the real map, about 4.8% of the cells are obstacles and the guard
+    visits about 27% of the cells before walking off the map.
+    """
+    side = _side(130, scale)
+    start, obstacles, visited = _guard_spiral(rng, side)
+
+    grid = [["."] * side for _ in range(side)]
+    for x, y in obstacles:
+        grid[y][x] = "#"
+    # The walk never steps onto unvisited cells, so more obstacles there
+    # leave it as it is; spread them to bring the total to 4.8%
+    free = side * side - len(visited) - len(obstacles)
+    density = max(0.0, 0.048 * side * side - len(obstacles)) / max(free, 1)
+    for y in range(side):
+        for x in range(side):
+            if (x, y) not in visited and rng.random() < density:
+                grid[y][x] = "#"
+    grid[start[1]][start[0]] = "^"
+    return _join(grid)
+
+
+def generate_day7(rng, scale):
+    """Calibration equations, about half of which are satisfiable."""
+    lines = []
+    for _ in range(_lines(850, scale)):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+        value = numbers[0]
+        for n in numbers[1:]:
+            op = rng.choice("+*|")
+            if op == "+":
+                value += n
+            elif op == "*":
+                value *= n
+            else:
+                value = int(f"{value}{n}")
+        if rng.random() < 0.5:
+            value += rng.randint(1, 9)
+        lines.append(f"{value}: {' '.join(map(str, numbers))}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day8(rng, scale):
+    """Antenna map with a handful of antennas per frequency."""
+    side = _side(50, scale)
+    grid = [["."] * side for _ in range(side)]
+    frequencies = string.ascii_letters + string.digits
+    for _ in range(_lines(200, scale)):
+        grid[rng.randrange(side)][rng.randrange(side)] = rng.choice(frequencies)
+    return _join(grid)
+
+
+def generate_day9(rng, scale):
+    """Dense disk map alternating file and free-space lengths."""
+    length = _lines(19999, scale) | 1  # must end with a file
+    return (
+        "".join(
+            str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9))
+            for i in range(length)
+        )
+        + "\n"
+    )
+
+
+def generate_day10(rng, scale):
+    """Topographic map of overlapping slopes so there are many hiking trails."""
+    side = _side(45, scale)
+    peaks = [
+        (rng.randrange(side), rng.randrange(side))
+        for _ in range(max(1, side * side // 80))
+    ]
+    rows = []
+    for y in range(side):
+        row = []
+        for x in range(side):
+            distance = min(abs(x - px) + abs(y - py) for px, py in peaks)
+            height = max(0, 9 - distance)
+            if rng.random() < 0.05:
+                height = rng.randint(0, 9)
+            row.append(str(height))
+        rows.append("".join(row))
+    return "\n".join(rows) + "\n"
+
+
+def generate_day11(rng, scale):
+    """Initial stone numbers."""
+    count = _lines(8, scale)
+    return " ".join(str(rng.randint(0, 999999)) for _ in range(count)) + "\n"
+
+
+def generate_day12(rng, scale):
+    """Garden map of irregular plant regions."""
+    side = _side(140, scale)
+    seeds = [
+        (rng.randrange(side), rng.randrange(side), rng.choice(string.ascii_uppercase))
+        for _ in range(max(1, side * side // 30))
+    ]
+    # Bucket seeds so each cell only looks at nearby ones
+    bucket = 8
+    buckets = {}
+    for sx, sy, plant in seeds:
+        buckets.setdefault((sx // bucket, sy // bucket), []).append((sx, sy, plant))
+    rows = []
+    for y in range(side):
+        row = []
+        for x in range(side):
+            best = None
+            radius = 1
+            while best is None:
+                for by in range(y // bucket - radius, y // bucket + radius + 1):
+                    for bx in range(x // bucket - radius, x // bucket + radius + 1):
+                        for sx, sy, plant in buckets.get((bx, by), ()):
+                            d = abs(sx - x) + abs(sy - y)
+                            if best is None or d < best[0]:
+                                best = (d, plant)
+                radius += 1
+            row.append(best[1])
+        rows.append("".join(row))
+    return "\n".join(rows) + "\n"
+
+
+def generate_day13(rng, scale):
+    """Claw machines, some of which are winnable within 100 presses."""
+    machines = []
+    for _ in range(_lines(320, scale)):
+        ax, ay = rng.randint(10, 99), rng.randint(10, 99)
+        bx, by = rng.randint(10, 99), rng.randint(10, 99)
+        if rng.random() < 0.5:
+            a, b = rng.randint(0, 100), rng.randint(0, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}\n"
+        )
+    return "\n".join(machines)
+
+
+def generate_day14(rng, scale):
+    """Robots on the fixed 101 x 103 floor."""
+    return "".join(
+        f"p={rng.randrange(101)},{rng.randrange(103)} "
+        f"v={rng.randint(-100, 100)},{rng.randint(-100, 100)}\n"
+        for _ in range(_lines(500, scale))
+    )
+
+
+def generate_day15(rng, scale):
+    """Warehouse map with boxes, then the robot's move list."""
+    side = _side(50, scale)
+    grid = _walled_grid(rng, side, side, 0.05)
+    for y in range(1, side - 1):
+        for x in range(1, side - 1):
+            if grid[y][x] == "." and rng.random() < 0.3:
+                grid[y][x] = "O"
+    grid[side // 2][side // 2] = "@"
+    moves = "".join(rng.choice("<>^v") for _ in range(_lines(2000, scale)))
+    move_lines = "\n".join(moves[i : i + 1000] for i in range(0, len(moves), 1000))
+    return _join(grid) + "\n" + move_lines + "\n"
+
+
+def generate_day16(rng, scale):
+    """Reindeer maze with S in the bottom-left and E in the top-right."""
+    grid = _maze(rng, _side(141, scale), extra_openings=0.03)
+    size = len(grid)
+    grid[size - 2][1] = "S"
+    grid[1][size - 2] = "E"
+    return _join(grid)
+
+
+def generate_day17(rng, scale):
+    """3-bit program whose output length grows with the bits of register A."""
+    bits = max(3, int(48 * scale))
+    a = rng.getrandbits(bits) | (1 << (bits - 1))
+    return (
+        f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\n"
+        "Program: 2,4,1,3,7,5,4,1,1,3,0,3,5,5,3,0\n"
+    )
+
+
+def generate_day18(rng, scale):
+    """Falling byte coordinates covering most of a square memory space."""
+    side = _side(71, scale)
+    cells = [(x, y) for y in range(side) for x in range(side)]
+    cells.remove((0, 0))
+    cells.remove((side - 1, side - 1))
+    rng.shuffle(cells)
+    count = int(len(cells) * 0.7)
+    return "".join(f"{x},{y}\n" for x, y in cells[:count])
+
+
+def generate_day19(rng, scale):
+    """Towel patterns followed by designs mostly built from those patterns."""
+    colors = "wubrg"
+    patterns = sorted(
+        {
+            "".join(rng.choice(colors) for _ in range(rng.randint(1, 8)))
+            for _ in range(450)
+        }
+    )
+    designs = []
+    for _ in range(_lines(400, scale)):
+        design = ""
+        target = rng.randint(20, 60)
+        while len(design) < target:
+            design += rng.choice(patterns)
+        if rng.random() < 0.3:
+            design += rng.choice(colors)
+        designs.append(design)
+    return ", ".join(patterns) + "\n\n" + "\n".join(designs) + "\n"
+
+
+def generate_day20(rng, scale):
+    """Single-track racetrack that snakes back and forth across the map."""
+    side = _side(141, scale)
+    side = side if side % 2 else side + 1
+    grid = [["#"] * side for _ in range(side)]
+    rows = list(range(1, side - 1, 2))
+    for i, y in enumerate(rows):
+        for x in range(1, side - 1):
+            grid[y][x] = "."
+        if i + 1 < len(rows):
+            grid[y + 1][side - 2 if i % 2 == 0 else 1] = "."
+    grid[rows[0]][1] = "S"
+    last = rows[-1]
+    grid[last][side - 2 if (len(rows) - 1) % 2 == 0 else 1] = "E"
+    return _join(grid)
+
+
+GENERATORS = {day: globals()[f"generate_day{day}"] for day in range(1, 21)}
+
+
+def generate(day, scale=1, seed=DEFAULT_SEED):
+    """Generate the input text for day at scale from a fixed seed."""
+    rng = random.Random(seed * 100 + day)
+    return GENERATORS[day](rng, scale)
@@ -0,0 +1,33 @@
+"""Project-wide logging setup.
+
+Solutions log through the standard logging module with one logger per
+module and %-style arguments, so a debug message is never formatted unless
+DEBUG is enabled. Output that is expensive to build even before formatting
+(grid dumps, per-region tables) is guarded with
+logger.isEnabledFor(logging.DEBUG) as well.
+
+The level comes from the AOC_LOG_LEVEL environment variable, e.g.
+
+    AOC_LOG_LEVEL=DEBUG python day8/solution_part1.py
+"""
+
+import logging
+import os
+import sys
+
+ENV_VAR = "AOC_LOG_LEVEL"
+FORMAT = "%(message)s"
+
+
+def configure(level=None, default: str = "INFO", stream=None):
+    """Set up the root logger.
+
+    level wins over AOC_LOG_LEVEL, which wins over default. Messages go to
+    stdout unless another stream is given.
+    """
+    level = level or os.environ.get(ENV_VAR) or default
+    if isinstance(level, str):
+        level = level.upper()
+    logging.basicConfig(
+        format=FORMAT, level=level, stream=stream or sys.stdout, force=True
+    )
@@ -0,0 +1,56 @@
+"""Process pools for the functions of a day module.
+
+Pool workers find a task function by pickling its module name and importing
+that name again. Day modules are imported by bare name from their day
+directory ("from batch import ..."), and the runner drops them from
+sys.modules and the day directory from sys.path once a solution is loaded,
+so that days don't collide. Neither the parent nor the workers could then
+find them by name.
+
+module_pool puts the task's module back under its name and the day
+directory back on sys.path while the pool is open. Forked workers inherit
+both, and spawned workers get the same sys.path and import the module anew.
+"""
+
+import os
+import sys
+import types
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+
+def _module_of(task: Callable) -> types.ModuleType:
+    """A module whose attributes are the globals task was defined with."""
+    module = sys.modules.get(task.__module__)
+    if module is not None and vars(module) is task.__globals__:
+        return module
+    module = types.ModuleType(task.__module__)
+    module.__dict__.update(task.__globals__)
+    return module
+
+
+@contextmanager
+def module_pool(
+    task: Callable,
+    workers: int,
+    initializer: Optional[Callable] = None,
+    initargs=(),
+) -> Iterator[ProcessPoolExecutor]:
+    """A process pool that can run task and the rest of its module."""
+    name = task.__module__
+    previous = sys.modules.get(name)
+    directory = os.path.dirname(os.path.abspath(task.__code__.co_filename))
+    sys.modules[name] = _module_of(task)
+    sys.path.insert(0, directory)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=initializer, initargs=initargs
+        ) as pool:
+            yield pool
+    finally:
+        sys.path.remove(directory)
+        if previous is None:
+            del sys.modules[name]
+        else:
+            sys.modules[name] = previous
@@ -0,0 +1,181 @@
+"""Opt-in per-function instrumentation for the solution modules.
+
+Nothing here touches a solution unless profiling is switched on, either with
+the runner's --profile flag or the AOC_PROFILE environment variable, so the
+overhead when it is off is zero. When it is on, the functions and methods of
+each loaded solution and of the modules it imports from its day directory
+are replaced with wrappers that record:
+
+- number of calls
+- cumulative (inclusive) and self time
+- net memory blocks allocated while the function was running
+
+Self time is also accumulated per call stack and written in the "folded"
+format that flamegraph.pl, speedscope and inferno read directly:
+
+    day6_part2.solve;day6_part2.find_loop_positions 1234567
+
+where the number is microseconds spent in the last frame of that stack.
+"""
+
+import functools
+import inspect
+import os
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+ENV_VAR = "AOC_PROFILE"
+FUNCTIONS_ENV_VAR = "AOC_PROFILE_FUNCTIONS"
+DEFAULT_OUTPUT = "profile.folded"
+
+
+@dataclass
+class FunctionStats:
+    """Totals for one instrumented function."""
+
+    name: str
+    calls: int = 0
+    cumulative_time: float = 0.0
+    self_time: float = 0.0
+    allocated_blocks: int = 0
+    active: int = 0  # recursion depth, so recursive time is counted once
+
+
+class Profiler:
+    """Collects call counts, timings and allocations for wrapped functions."""
+
+    def __init__(self):
+        self.stats: Dict[str, FunctionStats] = {}
+        self.stacks: Dict[Tuple[str, ...], float] = defaultdict(float)
+        # Each frame is [stack path, start time, time spent in children]
+        self._frames: List[list] = []
+        # Original function -> its wrapper
+        self._wrappers: Dict[object, object] = {}
+
+    def wrap(self, name: str, func):
+        """Return an instrumented version of func recorded under name."""
+        stats = self.stats.setdefault(name, FunctionStats(name))
+        frames = self._frames
+        stacks = self.stacks
+        clock = time.perf_counter
+        blocks = sys.getallocatedblocks
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            path = frames[-1][0] + (name,) if frames else (name,)
+            outermost = stats.active == 0
+            stats.calls += 1
+            stats.active += 1
+            blocks_before = blocks() if outermost else 0
+            frame = [path, clock(), 0.0]
+            frames.append(frame)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = clock() - frame[1]
+                frames.pop()
+                self_time = elapsed - frame[2]
+                stats.self_time += self_time
+                stacks[path] += self_time
+                if frames:
+                    frames[-1][2] += elapsed
+                stats.active -= 1
+                if outermost:
+                    stats.cumulative_time += elapsed
+                    stats.allocated_blocks += blocks() - blocks_before
+
+        wrapper.__wrapped_by_profiler__ = True
+        return wrapper
+
+    def instrument_module(
+        self,
+        module,
+        names: Optional[Iterable[str]] = None,
+        prefix: Optional[str] = None,
+    ):
+        """Wrap the module's functions and methods in place."""
+        self.instrument_modules([(prefix or module.__name__, module)], names)
+
+    def instrument_modules(
+        self,
+        modules: Iterable[Tuple[str, object]],
+        names: Optional[Iterable[str]] = None,
+    ):
+        """Wrap the functions and class methods defined in each (prefix, module).
+
+        Calls between functions of the same module go through the module's
+        globals, so replacing the attribute is enough to catch internal calls.
+        Functions a module imported from another instrumented module are
+        pointed at that module's wrapper, so each function is recorded once
+        under the module that defines it.
+        """
+        wanted = set(names) if names else None
+        modules = list(modules)
+        for prefix, module in modules:
+            for attr, value in list(vars(module).items()):
+                if inspect.isfunction(value) and value.__module__ == module.__name__:
+                    if wanted is None or attr in wanted:
+                        self._replace(module, attr, value, f"{prefix}.{attr}")
+                elif inspect.isclass(value) and value.__module__ == module.__name__:
+                    for method, func in list(vars(value).items()):
+                        qualified = f"{attr}.{method}"
+                        if not inspect.isfunction(func) or method.startswith("__"):
+                            continue
+                        if wanted is None or method in wanted or qualified in wanted:
+                            self._replace(value, method, func, f"{prefix}.{qualified}")
+
+        for _, module in modules:
+            for attr, value in list(vars(module).items()):
+                if inspect.isfunction(value) and value in self._wrappers:
+                    setattr(module, attr, self._wrappers[value])
+
+    def _replace(self, owner, attr: str, func, name: str):
+        if getattr(func, "__wrapped_by_profiler__", False):
+            return
+        wrapper = self._wrappers.get(func) or self.wrap(name, func)
+        self._wrappers[func] = wrapper
+        setattr(owner, attr, wrapper)
+
+    def format_report(self, limit: Optional[int] = None) -> str:
+        """Table of the instrumented functions, slowest first."""
+        rows = sorted(
+            (s for s in self.stats.values() if s.calls),
+            key=lambda s: s.cumulative_time,
+            reverse=True,
+        )[:limit]
+        width = max((len(s.name) for s in rows), default=8)
+        lines = [
+            f"{'function':<{width}}  {'calls':>10}  {'cumulative':>11}  "
+            f"{'self':>11}  {'net blocks':>11}"
+        ]
+        for s in rows:
+            lines.append(
+                f"{s.name:<{width}}  {s.calls:>10}  {s.cumulative_time:>10.4f}s  "
+                f"{s.self_time:>10.4f}s  {s.allocated_blocks:>11}"
+            )
+        return "\n".join(lines)
+
+    def write_folded(self, path: str):
+        """Write self time per call stack in flame graph folded format."""
+        with open(path, "w") as f:
+            for stack, seconds in sorted(self.stacks.items()):
+                micros = int(seconds * 1_000_000)
+                if micros:
+                    f.write(f"{';'.join(stack)} {micros}\n")
+
+
+def output_from_env() -> Optional[str]:
+    """Folded output path requested through AOC_PROFILE, if any."""
+    value = os.environ.get(ENV_VAR, "")
+    if not value or value == "0":
+        return None
+    return DEFAULT_OUTPUT if value == "1" else value
+
+
+def functions_from_env() -> Optional[List[str]]:
+    """Function names to restrict instrumentation to, from AOC_PROFILE_FUNCTIONS."""
+    value = os.environ.get(FUNCTIONS_ENV_VAR, "")
+    return [name.strip() for name in value.split(",") if name.strip()] or None
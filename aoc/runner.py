@@ -0,0 +1,427 @@
+"""Run every dayN/solution_partK.py in a single process and time each part.
+
+Usage (from the repository root):
+
+    python -m aoc.runner
+    python -m aoc.runner --days 1 2 3 --repeat 5
+    python -m aoc.runner --days 10 --input test_input.txt --verbose
+    python -m aoc.runner --days 6 --profile day6.folded
+    python -m aoc.runner --workers 8
+    python -m aoc.runner --cache
+"""
+
+import argparse
+import importlib.util
+import io
+import logging
+import os
+import re
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+from aoc import profiling
+from aoc.cache import (
+    DEFAULT_DIR as DEFAULT_CACHE_DIR,
+    DEFAULT_MAX_BYTES as DEFAULT_CACHE_BYTES,
+    ENV_VAR as CACHE_ENV_VAR,
+    ResultCache,
+    directory_from_env as cache_directory_from_env,
+    make_key,
+)
+from aoc.log import ENV_VAR as LOG_LEVEL_ENV_VAR, configure as configure_logging
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAY_PATTERN = re.compile(r"^day(\d+)$")
+PART_PATTERN = re.compile(r"^solution_part(\d+)\.py$")
+
+# Day modules import the shared aoc package by name. A solution run directly
+# as a script puts the root on sys.path itself; loaded from here it relies on
+# this one entry.
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@dataclass
+class PartResult:
+    """Answer and measurements for one run of one (day, part)."""
+
+    day: int
+    part: int
+    answer: Any = None
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory: Optional[int] = None  # bytes, None when not tracked
+    error: Optional[str] = None
+    output: str = ""  # what the solution printed or logged while running
+    cached: bool = False  # answer came from the result cache, nothing was run
+
+
+def discover_solutions(root: str = ROOT) -> List[Tuple[int, int, str]]:
+    """Find all (day, part, path) solution files under root, sorted by day and part."""
+    solutions = []
+    for entry in os.listdir(root):
+        day_match = DAY_PATTERN.match(entry)
+        day_dir = os.path.join(root, entry)
+        if not day_match or not os.path.isdir(day_dir):
+            continue
+        for filename in os.listdir(day_dir):
+            part_match = PART_PATTERN.match(filename)
+            if part_match:
+                solutions.append(
+                    (
+                        int(day_match.group(1)),
+                        int(part_match.group(1)),
+                        os.path.join(day_dir, filename),
+                    )
+                )
+    return sorted(solutions)
+
+
+def load_solution(
+    day: int,
+    part: int,
+    path: str,
+    profiler: Optional[profiling.Profiler] = None,
+    profile_functions: Optional[List[str]] = None,
+):
+    """Import a solution file as module day{day}_part{part}.
+
+    With a profiler, the solution and the modules it imported from its day
+    directory are instrumented.
+    """
+    day_dir = os.path.dirname(path)
+    name = f"day{day}_part{part}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+
+    # Some solutions import sibling files directly (day14 part 2 does
+    # "from solution_part1 import ..."), so make the day directory importable
+    # while loading and drop the siblings afterwards so days don't collide.
+    sys.path.insert(0, day_dir)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(day_dir)
+        siblings = []
+        for sibling, loaded in list(sys.modules.items()):
+            location = getattr(loaded, "__file__", None)
+            if location and os.path.dirname(os.path.abspath(location)) == day_dir:
+                siblings.append((f"day{day}.{sibling}", loaded))
+                del sys.modules[sibling]
+
+    if profiler:
+        profiler.instrument_modules(siblings + [(name, module)], profile_functions)
+    sys.modules[name] = module
+    return module
+
+
+def get_solver(module, part: int) -> Callable[[str], Any]:
+    """Return the solve(filename) entry point of a solution module."""
+    for attr in ("solve", f"solve_part{part}"):
+        solver = getattr(module, attr, None)
+        if callable(solver):
+            return solver
+    raise AttributeError(f"{module.__name__} has no solve() entry point")
+
+
+def run_part(
+    day: int,
+    part: int,
+    solver: Callable[[str], Any],
+    input_path: str,
+    track_memory: bool = True,
+) -> PartResult:
+    """Call solver on input_path and measure wall time, CPU time and peak memory.
+
+    Everything the solver prints or logs is captured in result.output.
+    """
+    result = PartResult(day, part)
+    sink = io.StringIO()
+    handlers = [
+        h for h in logging.getLogger().handlers if isinstance(h, logging.StreamHandler)
+    ]
+    streams = [h.setStream(sink) for h in handlers]
+
+    if track_memory:
+        tracemalloc.start()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        with redirect_stdout(sink):
+            result.answer = solver(input_path)
+    except (Exception, SystemExit) as e:
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        result.cpu_time = time.process_time() - cpu_start
+        result.wall_time = time.perf_counter() - wall_start
+        if track_memory:
+            result.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        for handler, stream in zip(handlers, streams):
+            handler.setStream(stream)
+        result.output = sink.getvalue()
+
+    return result
+
+
+def format_result(result: PartResult) -> str:
+    """Format a result as one report line."""
+    answer = result.error if result.error else result.answer
+    memory = (
+        f"{result.peak_memory / 1024:>10.1f} KiB"
+        if result.peak_memory is not None
+        else f"{'-':>14}"
+    )
+    return (
+        f"day{result.day:<3} part{result.part}  "
+        f"wall {result.wall_time:>9.4f}s  cpu {result.cpu_time:>9.4f}s  "
+        f"peak {memory}  {answer}{'  (cached)' if result.cached else ''}"
+    )
+
+
+def report(result: PartResult, verbose: bool = False):
+    """Print a result line, followed by the solution's own output if verbose."""
+    print(format_result(result))
+    if verbose and result.output:
+        for line in result.output.rstrip("\n").split("\n"):
+            print(f"    | {line}")
+
+
+def cache_key(
+    cache: Optional[ResultCache], part: int, path: str, input_path: str
+) -> Optional[str]:
+    """Result cache key for a job, or None without a cache or readable input."""
+    if cache is None:
+        return None
+    try:
+        return make_key(input_path, path, part)
+    except OSError:
+        return None
+
+
+def cached_result(
+    cache: Optional[ResultCache], key: Optional[str], day: int, part: int
+) -> Optional[PartResult]:
+    """The stored result for key, if there is one."""
+    if key is None:
+        return None
+    found, answer = cache.lookup(key)
+    return PartResult(day, part, answer, cached=True) if found else None
+
+
+def store_result(cache: Optional[ResultCache], key: Optional[str], result: PartResult):
+    """Remember a successful answer under key."""
+    if key is not None and not result.error and not result.cached:
+        cache.put(key, result.answer)
+
+
+# Solvers loaded by this worker process, keyed by solution path
+_worker_solvers = {}
+
+
+def _init_worker(log_level):
+    configure_logging(log_level, default="WARNING", stream=sys.stderr)
+
+
+def _run_job(job: Tuple[int, int, str, str, bool]) -> PartResult:
+    """Run one (day, part) inside a pool worker, importing it on first use."""
+    day, part, path, input_path, track_memory = job
+    if path not in _worker_solvers:
+        _worker_solvers[path] = get_solver(load_solution(day, part, path), part)
+    return run_part(day, part, _worker_solvers[path], input_path, track_memory)
+
+
+def run_all(
+    days: Optional[List[int]] = None,
+    parts: Optional[List[int]] = None,
+    input_name: str = "input.txt",
+    repeat: int = 1,
+    track_memory: bool = True,
+    verbose: bool = False,
+    root: str = ROOT,
+    profiler: Optional[profiling.Profiler] = None,
+    profile_functions: Optional[List[str]] = None,
+    workers: int = 1,
+    log_level: Optional[str] = None,
+    cache: Optional[ResultCache] = None,
+) -> List[PartResult]:
+    """Import the selected solutions once and run each of them repeat times.
+
+    With a profiler, each solution and its sibling modules are instrumented
+    right after import; without one the modules are left untouched.
+
+    With workers > 1 the (day, part) jobs are spread over a process pool.
+    Each worker imports a solution the first time it gets one of its jobs.
+    Results are still returned and reported in day, part order.
+
+    With a cache, a job whose input and solution source are unchanged since
+    its answer was stored is answered from the cache without running it.
+    """
+    selected = [
+        (day, part, path)
+        for day, part, path in discover_solutions(root)
+        if (not days or day in days) and (not parts or part in parts)
+    ]
+
+    if workers > 1:
+        jobs = [
+            (
+                day,
+                part,
+                path,
+                os.path.join(os.path.dirname(path), input_name),
+                track_memory,
+            )
+            for _ in range(repeat)
+            for day, part, path in selected
+        ]
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(log_level,)
+        ) as pool:
+            pending = []
+            for job in jobs:
+                day, part, path, input_path, _ = job
+                key = cache_key(cache, part, path, input_path)
+                result = cached_result(cache, key, day, part)
+                pending.append((key, result or pool.submit(_run_job, job)))
+            for key, item in pending:
+                result = item if isinstance(item, PartResult) else item.result()
+                store_result(cache, key, result)
+                report(result, verbose)
+                results.append(result)
+        return results
+
+    jobs = []
+    for day, part, path in selected:
+        module = load_solution(day, part, path, profiler, profile_functions)
+        input_path = os.path.join(os.path.dirname(path), input_name)
+        key = cache_key(cache, part, path, input_path)
+        jobs.append((day, part, get_solver(module, part), input_path, key))
+
+    results = []
+    for _ in range(repeat):
+        for day, part, solver, input_path, key in jobs:
+            result = cached_result(cache, key, day, part)
+            if result is None:
+                result = run_part(day, part, solver, input_path, track_memory)
+                store_result(cache, key, result)
+            report(result, verbose)
+            results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run and time all solutions")
+    parser.add_argument("--days", type=int, nargs="+", help="Days to run (default all)")
+    parser.add_argument(
+        "--parts", type=int, nargs="+", help="Parts to run (default all)"
+    )
+    parser.add_argument(
+        "--input", default="input.txt", help="Input file name inside each day directory"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per part")
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip tracemalloc peak memory tracking (it slows solutions down)",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Show each solution's own output under its result line",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Run (day, part) jobs in this many worker processes",
+    )
+    parser.add_argument(
+        "--log-level",
+        help=f"Log level for the solutions (default WARNING, or {LOG_LEVEL_ENV_VAR})",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=profiling.DEFAULT_OUTPUT,
+        help=f"Instrument solution functions and write a folded flame graph "
+        f"file (default {profiling.DEFAULT_OUTPUT}); also enabled by "
+        f"{profiling.ENV_VAR}=1 or {profiling.ENV_VAR}=PATH",
+    )
+    parser.add_argument(
+        "--profile-functions",
+        nargs="+",
+        help="Only instrument these function names (default all), also "
+        f"settable as a comma separated {profiling.FUNCTIONS_ENV_VAR}",
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=DEFAULT_CACHE_DIR,
+        help="Reuse answers for unchanged inputs and solutions, stored in this "
+        f"directory (default {os.path.relpath(DEFAULT_CACHE_DIR)}); also enabled "
+        f"by {CACHE_ENV_VAR}=PATH",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_BYTES,
+        help="Evict least recently used answers beyond this many bytes",
+    )
+    parser.add_argument(
+        "--clear-cache", action="store_true", help="Empty the cache before running"
+    )
+    args = parser.parse_args(argv)
+    configure_logging(args.log_level, default="WARNING", stream=sys.stderr)
+
+    profile_output = args.profile or profiling.output_from_env()
+    profiler = profiling.Profiler() if profile_output else None
+    if profiler and args.workers > 1:
+        parser.error("profiling needs --workers 1")
+
+    cache_dir = args.cache or cache_directory_from_env()
+    cache = ResultCache(cache_dir, args.cache_size) if cache_dir else None
+    if cache and args.clear_cache:
+        cache.clear()
+
+    start = time.perf_counter()
+    results = run_all(
+        days=args.days,
+        parts=args.parts,
+        input_name=args.input,
+        repeat=args.repeat,
+        track_memory=not args.no_memory,
+        verbose=args.verbose,
+        profiler=profiler,
+        profile_functions=args.profile_functions or profiling.functions_from_env(),
+        workers=args.workers,
+        log_level=args.log_level,
+        cache=cache,
+    )
+    elapsed = time.perf_counter() - start
+
+    total_wall = sum(r.wall_time for r in results)
+    total_cpu = sum(r.cpu_time for r in results)
+    print(
+        f"\nTotal: wall {total_wall:.4f}s  cpu {total_cpu:.4f}s  ({len(results)} runs)"
+        f"  elapsed {elapsed:.4f}s"
+    )
+    if cache:
+        print(f"Cache: {cache.hits} hits, {cache.misses} misses")
+    if profiler:
+        print()
+        print(profiler.format_report())
+        profiler.write_folded(profile_output)
+        print(f"\nFolded stacks written to {profile_output}")
+
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
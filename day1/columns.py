@@ -0,0 +1,47 @@
+"""Columnar day 1 helpers that keep the two location lists in numpy arrays.
+
+The whole file is parsed in one vectorized pass over its bytes, so there is
+no per-line Python work and no boxed ints.
+"""
+
+from aoc.arrays import NUMPY_AVAILABLE, np, parse_numbers  # noqa: F401
+
+# Above this, counting with bincount would allocate more than it saves
+MAX_BINCOUNT_ID = 1 << 24
+
+
+def read_columns(filename="input.txt"):
+    """Read the input file into left and right int64 arrays."""
+    try:
+        with open(filename, "rb") as file:
+            numbers = parse_numbers(file.read())
+    except FileNotFoundError:
+        print(f"Error: {filename} not found. Please create an input file.")
+        exit(1)
+
+    if len(numbers) % 2:
+        raise ValueError(f"{filename} has an unpaired location ID")
+    return numbers[0::2], numbers[1::2]
+
+
+def total_distance(left, right) -> int:
+    """Sum of distances between the sorted columns."""
+    return int(np.abs(np.sort(left) - np.sort(right)).sum())
+
+
+def similarity_score(left, right) -> int:
+    """Sum of each left ID times how often it appears in the right column."""
+    if not len(left) or not len(right):
+        return 0
+
+    if right.max() < MAX_BINCOUNT_ID and left.min() >= 0 and right.min() >= 0:
+        counts = np.bincount(right)
+        # Left IDs beyond the largest right ID have no matches
+        matched = left[left < len(counts)]
+        return int((matched * counts[matched]).sum())
+
+    # Sparse IDs: join against the distinct right values instead
+    values, counts = np.unique(right, return_counts=True)
+    slots = np.searchsorted(values, left).clip(max=len(values) - 1)
+    found = values[slots] == left
+    return int((left[found] * counts[slots[found]]).sum())
@@ -0,0 +1,207 @@
+"""Day 1 total distance by external merge sort, for inputs larger than RAM.
+
+The file is read in chunks of whole lines, parsed straight into int64
+arrays, and each column is copied into a preallocated buffer. When a buffer
+is full it is sorted in place and written to a temporary file as a run of
+raw int64 values. Afterwards the runs of each column are k-way merged, and
+the two merged streams are paired and summed on the fly, so the sorted
+columns never exist in memory as a whole.
+
+Everything is sized from one memory budget, buffer_size: half of it goes to
+the two column buffers, the other half to parsing a chunk, whose
+temporaries take about PARSE_BYTES_PER_BYTE times the chunk size. During
+the merge the read blocks of all open runs share the whole budget, each of
+at least MIN_READ_ITEMS. When there are more runs than that allows, groups
+of runs are first merged into longer runs on disk, a pass at a time, until
+the runs of both columns can be merged at once. Peak memory is therefore
+about buffer_size plus a fixed overhead of roughly 100 KB for the run file
+names, open files and generators, which only matters for budgets far below
+the default. buffer_size must be at least MIN_BUFFER_SIZE. numpy is
+required.
+"""
+
+import heapq
+import os
+import tempfile
+from array import array
+from typing import Iterator, List, Optional
+
+from aoc.arrays import NUMPY_AVAILABLE, np, parse_numbers
+
+DEFAULT_BUFFER_SIZE = 64 << 20  # bytes of memory for the whole sort
+ITEM_SIZE = array("q").itemsize
+MIN_READ_ITEMS = 1024
+MIN_CHUNK_SIZE = 512
+# Room for the read blocks of two runs and one merged output block
+MIN_BUFFER_SIZE = 3 * MIN_READ_ITEMS * ITEM_SIZE
+
+# Peak bytes of parse_numbers temporaries per input byte (a few int64
+# arrays with one entry per digit)
+PARSE_BYTES_PER_BYTE = 40
+
+
+def chunk_size_for(buffer_size: int) -> int:
+    """Bytes of input to parse at a time within half of buffer_size."""
+    return max(MIN_CHUNK_SIZE, buffer_size // (2 * PARSE_BYTES_PER_BYTE))
+
+
+def read_number_chunks(filename: str, chunk_size: int) -> Iterator:
+    """Yield int64 arrays of the numbers in each chunk of whole lines."""
+    try:
+        file = open(filename, "rb")
+    except FileNotFoundError:
+        print(f"Error: {filename} not found. Please create an input file.")
+        exit(1)
+
+    with file:
+        remainder = b""
+        while True:
+            block = file.read(chunk_size)
+            if not block:
+                break
+            # Hold back the last partial line until the next chunk completes it
+            cut = block.rfind(b"\n") + 1
+            if not cut:
+                remainder += block
+                continue
+            yield parse_numbers(remainder + block[:cut])
+            remainder = block[cut:]
+        if remainder.strip():
+            yield parse_numbers(remainder)
+
+
+class RunWriter:
+    """Buffers IDs and writes them out as sorted runs."""
+
+    def __init__(self, directory: str, name: str, buffer_items: int):
+        self.directory = directory
+        self.name = name
+        self.buffer = np.empty(max(1, buffer_items), dtype=np.int64)
+        self.used = 0
+        self.paths: List[str] = []
+
+    def add(self, numbers):
+        """Buffer an int64 array of IDs, writing runs whenever the buffer fills."""
+        while len(numbers):
+            take = min(len(numbers), len(self.buffer) - self.used)
+            self.buffer[self.used : self.used + take] = numbers[:take]
+            self.used += take
+            numbers = numbers[take:]
+            if self.used == len(self.buffer):
+                self.flush()
+
+    def flush(self):
+        """Sort the buffered IDs in place and write them as a new run."""
+        if not self.used:
+            return
+        run = self.buffer[: self.used]
+        run.sort()
+        path = os.path.join(self.directory, f"{self.name}-{len(self.paths)}.bin")
+        run.tofile(path)
+        self.paths.append(path)
+        self.used = 0
+
+
+def read_run(path: str, read_items: int) -> Iterator[int]:
+    """Stream the IDs of a run file, read_items at a time."""
+    block = array("q", [0]) * read_items
+    # Unbuffered, straight into the block: it is the only buffer of the run
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(block)
+            if not size:
+                return
+            yield from memoryview(block)[: size // ITEM_SIZE]
+
+
+def merge_runs(paths: List[str], read_items: int) -> Iterator[int]:
+    """All IDs of the runs in sorted order."""
+    return heapq.merge(*(read_run(path, read_items) for path in paths))
+
+
+def write_run(path: str, numbers: Iterator[int], write_items: int):
+    """Write a stream of IDs to a run file, write_items at a time."""
+    with open(path, "wb", buffering=0) as f:
+        block = array("q")
+        for number in numbers:
+            block.append(number)
+            if len(block) == write_items:
+                block.tofile(f)
+                block = array("q")
+        block.tofile(f)
+
+
+def reduce_runs(paths: List[str], max_runs: int, buffer_size: int) -> List[str]:
+    """Merge groups of runs into longer runs until at most max_runs are left.
+
+    Each group merge keeps one read block per input run and one write block
+    for its output within buffer_size.
+    """
+    fan_in = max(2, buffer_size // (MIN_READ_ITEMS * ITEM_SIZE) - 1)
+    block_items = buffer_size // (ITEM_SIZE * (fan_in + 1))
+    merge_pass = 0
+    while len(paths) > max_runs:
+        merged = []
+        for start in range(0, len(paths), fan_in):
+            group = paths[start : start + fan_in]
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            path = f"{group[0]}.{merge_pass}"
+            write_run(path, merge_runs(group, block_items), block_items)
+            for done in group:
+                os.remove(done)
+            merged.append(path)
+        paths = merged
+        merge_pass += 1
+    return paths
+
+
+def external_total_distance(
+    filename: str,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    chunk_size: Optional[int] = None,
+    tmpdir: Optional[str] = None,
+) -> int:
+    """Total distance between the sorted columns, sorting them on disk.
+
+    chunk_size defaults to what fits in the parsing half of buffer_size.
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("the external sort needs numpy")
+    if buffer_size < MIN_BUFFER_SIZE:
+        raise ValueError(f"buffer_size must be at least {MIN_BUFFER_SIZE} bytes")
+    chunk_size = chunk_size or chunk_size_for(buffer_size)
+    # A quarter of the budget for each column's buffer
+    buffer_items = buffer_size // (4 * ITEM_SIZE)
+
+    with tempfile.TemporaryDirectory(prefix="day1-", dir=tmpdir) as directory:
+        left = RunWriter(directory, "left", buffer_items)
+        right = RunWriter(directory, "right", buffer_items)
+        for numbers in read_number_chunks(filename, chunk_size):
+            if len(numbers) % 2:
+                raise ValueError(f"{filename} has an unpaired location ID")
+            left.add(numbers[0::2])
+            right.add(numbers[1::2])
+            # Free this chunk's numbers before the next chunk is parsed
+            del numbers
+        left.flush()
+        right.flush()
+        # Release the run buffers before the merge takes the budget
+        left.buffer = right.buffer = None
+
+        # Both columns are merged at once, so each gets half of the read blocks
+        max_runs = max(1, buffer_size // (2 * MIN_READ_ITEMS * ITEM_SIZE))
+        left_paths = reduce_runs(left.paths, max_runs, buffer_size)
+        right_paths = reduce_runs(right.paths, max_runs, buffer_size)
+
+        # Share the same memory between the read buffers of every run
+        runs = len(left_paths) + len(right_paths)
+        read_items = buffer_size // (ITEM_SIZE * max(runs, 1))
+
+        total_distance = 0
+        for a, b in zip(
+            merge_runs(left_paths, read_items), merge_runs(right_paths, read_items)
+        ):
+            total_distance += abs(a - b)
+        return total_distance
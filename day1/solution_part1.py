@@ -1,3 +1,13 @@
+import os
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from columns import NUMPY_AVAILABLE, read_columns, total_distance  # noqa: E402
+from external_sort import external_total_distance  # noqa: E402
+
+
 def read_input(filename="input.txt"):
     """Read the input file and return two separate lists for sorting."""
     left_list = []
@@ -34,12 +44,23 @@ def calculate_total_distance(left_list, right_list):
     return total_distance
 
 
-def main():
-    # Read input with a specific file path
-    left_list, right_list = read_input("day1/input.txt")
+def solve(filename, external=False):
+    """Solve part 1 for the given input file.
+
+    With external=True both columns are sorted on disk, for inputs larger
+    than RAM.
+    """
+    if external:
+        return external_total_distance(filename)
+    if NUMPY_AVAILABLE:
+        return total_distance(*read_columns(filename))
+    left_list, right_list = read_input(filename)
+    return calculate_total_distance(left_list, right_list)
 
+
+def main():
     # Calculate and print result
-    result = calculate_total_distance(left_list, right_list)
+    result = solve("day1/input.txt")
     print(f"The total distance between the sorted lists is: {result}")
 
 
@@ -1,3 +1,13 @@
+import os
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from columns import NUMPY_AVAILABLE, read_columns, similarity_score  # noqa: E402
+from streaming import streaming_similarity_score  # noqa: E402
+
+
 def read_input(filename="input.txt"):
     """Read the input file and return two separate lists."""
     left_list = []
@@ -37,12 +47,23 @@ def calculate_similarity_score(left_list, right_list):
     return total_score
 
 
-def main():
-    # Read input with a specific file path
-    left_list, right_list = read_input("day1/input.txt")
+def solve(filename, streaming=False):
+    """Solve part 2 for the given input file.
+
+    With streaming=True the file is never held in memory as a whole, for
+    inputs larger than RAM.
+    """
+    if streaming:
+        return streaming_similarity_score(filename)
+    if NUMPY_AVAILABLE:
+        return similarity_score(*read_columns(filename))
+    left_list, right_list = read_input(filename)
+    return calculate_similarity_score(left_list, right_list)
 
+
+def main():
     # Calculate and print result
-    result = calculate_similarity_score(left_list, right_list)
+    result = solve("day1/input.txt")
     print(f"The similarity score is: {result}")
 
 
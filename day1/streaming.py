@@ -0,0 +1,229 @@
+"""Day 1 similarity score in bounded memory, for inputs larger than RAM.
+
+The file is read in fixed-size chunks and both columns are counted as they
+stream past. The similarity score only depends on those counts:
+
+    sum(id * left_count[id] * right_count[id])
+
+so nothing else is kept. While the counts fit in max_entries they live in a
+dict; past that they are spilled to partition files on disk (ID hashed to a
+partition) and the dict starts over. At the end the partitions are joined one
+at a time: the right side's counts of a partition are loaded into a dict and
+the left side's records are streamed past it in blocks of BLOCK_ITEMS.
+
+A right partition with more than max_entries records is split again with a
+differently seeded hash before it is joined, together with its left
+partition, until every partition fits. So memory stays bounded by the chunk
+size plus max_entries counts however many distinct IDs the input has. A
+split that leaves every record in one piece means the partition holds a
+handful of IDs spilled many times over, and it is loaded as it is.
+"""
+
+import os
+import tempfile
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # bytes read at a time
+DEFAULT_MAX_ENTRIES = 1 << 20  # distinct IDs counted in memory before spilling
+DEFAULT_PARTITIONS = 64
+BLOCK_ITEMS = 4096  # (id, count) pairs read or buffered per partition file
+MAX_FANOUT = 256  # partitions a single split writes to
+
+RECORD_SIZE = 2 * array("q").itemsize
+
+# splitmix64 finalizer, seeded per split level, spreads sequential IDs evenly
+# over the partitions and partitions again independently at every level
+GOLDEN = 0x9E3779B97F4A7C15
+MIX1 = 0xBF58476D1CE4E5B9
+MIX2 = 0x94D049BB133111EB
+MASK = (1 << 64) - 1
+
+
+def bucket(number: int, partitions: int, level: int = 0) -> int:
+    """The partition of number among partitions at the given split level."""
+    h = (number + (level + 1) * GOLDEN) & MASK
+    h = ((h ^ (h >> 30)) * MIX1) & MASK
+    h = ((h ^ (h >> 27)) * MIX2) & MASK
+    return (h ^ (h >> 31)) % partitions
+
+
+def record_count(path: str) -> int:
+    """Number of (id, count) pairs in a partition file, 0 if there is none."""
+    try:
+        return os.path.getsize(path) // RECORD_SIZE
+    except FileNotFoundError:
+        return 0
+
+
+def read_records(path: str) -> Iterator[Tuple[int, int]]:
+    """Stream the (id, count) pairs of a partition file, BLOCK_ITEMS at a time."""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        while True:
+            values = array("q")
+            values.frombytes(f.read(BLOCK_ITEMS * RECORD_SIZE))
+            if not values:
+                return
+            yield from zip(values[0::2], values[1::2])
+
+
+def write_partitions(
+    records: Iterable[Tuple[int, int]], paths: List[str], level: int
+) -> List[int]:
+    """Append records to the partition files in paths; records per partition."""
+    partitions = len(paths)
+    buckets = [array("q") for _ in range(partitions)]
+    written = [0] * partitions
+
+    def flush(p):
+        with open(paths[p], "ab") as f:
+            buckets[p].tofile(f)
+        written[p] += len(buckets[p]) // 2
+        buckets[p] = array("q")
+
+    for number, count in records:
+        p = bucket(number, partitions, level)
+        buckets[p].extend((number, count))
+        if len(buckets[p]) >= 2 * BLOCK_ITEMS:
+            flush(p)
+    for p in range(partitions):
+        if buckets[p]:
+            flush(p)
+    return written
+
+
+def sum_counts(records: Iterable[Tuple[int, int]]) -> Dict[int, int]:
+    """Total count per ID over (id, count) records that may repeat IDs."""
+    counts: Dict[int, int] = {}
+    for number, count in records:
+        counts[number] = counts.get(number, 0) + count
+    return counts
+
+
+def join_partition(
+    left_path: str, right_path: str, max_entries: int, level: int = 1
+) -> int:
+    """Similarity score of the IDs in one pair of matching partition files.
+
+    The right side is split first; if that leaves every record in one
+    partition the split is abandoned and the partition loaded as it is.
+    """
+    if not record_count(left_path):
+        return 0
+    records = record_count(right_path)
+    if records > max_entries:
+        fanout = min(MAX_FANOUT, -(-records // max_entries) + 1)
+        right_paths = [f"{right_path}.{p}" for p in range(fanout)]
+        written = write_partitions(read_records(right_path), right_paths, level)
+        if max(written) < records:
+            left_paths = [f"{left_path}.{p}" for p in range(fanout)]
+            write_partitions(read_records(left_path), left_paths, level)
+            for path in (left_path, right_path):
+                os.remove(path)
+            return sum(
+                join_partition(left, right, max_entries, level + 1)
+                for left, right in zip(left_paths, right_paths)
+            )
+        for path in right_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    right_counts = sum_counts(read_records(right_path))
+    return sum(
+        number * count * right_counts.get(number, 0)
+        for number, count in read_records(left_path)
+    )
+
+
+def read_chunks(
+    filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Tuple[List[int], List[int]]]:
+    """Yield (left IDs, right IDs) for each chunk of whole lines in the file."""
+    try:
+        file = open(filename, "rb")
+    except FileNotFoundError:
+        print(f"Error: {filename} not found. Please create an input file.")
+        exit(1)
+
+    with file:
+        remainder = b""
+        while True:
+            block = file.read(chunk_size)
+            if not block:
+                break
+            # Hold back the last partial line until the next chunk completes it
+            cut = block.rfind(b"\n") + 1
+            if not cut:
+                remainder += block
+                continue
+            numbers = list(map(int, (remainder + block[:cut]).split()))
+            remainder = block[cut:]
+            yield numbers[0::2], numbers[1::2]
+        if remainder.strip():
+            numbers = list(map(int, remainder.split()))
+            yield numbers[0::2], numbers[1::2]
+
+
+class SpillingCounter:
+    """Exact counts of integer IDs that spill to partition files when too many."""
+
+    def __init__(
+        self,
+        directory: str,
+        name: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        partitions: int = DEFAULT_PARTITIONS,
+    ):
+        self.counts: Dict[int, int] = {}
+        self.max_entries = max_entries
+        self.partitions = partitions
+        self.paths = [
+            os.path.join(directory, f"{name}-{p}.bin") for p in range(partitions)
+        ]
+        self.spilled = False
+
+    def add(self, numbers: Iterable[int]):
+        counts = self.counts
+        for number in numbers:
+            counts[number] = counts.get(number, 0) + 1
+            if len(counts) >= self.max_entries:
+                self.spill()
+                counts = self.counts
+
+    def spill(self):
+        """Append the in-memory counts to the partition files as (id, count) pairs."""
+        write_partitions(self.counts.items(), self.paths, level=0)
+        self.counts = {}
+        self.spilled = True
+
+
+def streaming_similarity_score(
+    filename: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    partitions: int = DEFAULT_PARTITIONS,
+    tmpdir: Optional[str] = None,
+) -> int:
+    """Similarity score of the file's two columns in one streaming pass."""
+    with tempfile.TemporaryDirectory(prefix="day1-", dir=tmpdir) as directory:
+        left = SpillingCounter(directory, "left", max_entries, partitions)
+        right = SpillingCounter(directory, "right", max_entries, partitions)
+        for lefts, rights in read_chunks(filename, chunk_size):
+            left.add(lefts)
+            right.add(rights)
+
+        if not left.spilled and not right.spilled:
+            return sum(
+                number * count * right.counts.get(number, 0)
+                for number, count in left.counts.items()
+            )
+
+        # Same partitioning on both sides, so each ID only meets its partition
+        left.spill()
+        right.spill()
+        return sum(
+            join_partition(left_path, right_path, max_entries)
+            for left_path, right_path in zip(left.paths, right.paths)
+        )
@@ -1,11 +1,23 @@
+import logging
+import os
+import sys
 from collections import deque
 
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import Grid  # noqa: E402
+from aoc.log import configure  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+SUMMIT = ord("9")
+
 
 def read_input(filename="input.txt"):
     """Read the topographic map from input file."""
     try:
-        with open(f"day10/{filename}", "r") as file:
-            return [list(map(int, line.strip())) for line in file]
+        return Grid.from_file(filename)
     except FileNotFoundError:
         print(f"Error: {filename} not found.")
         exit(1)
@@ -13,45 +25,25 @@ def read_input(filename="input.txt"):
 
 def find_trailheads(topo_map):
     """Find all positions with height 0 (trailheads)."""
-    rows, cols = len(topo_map), len(topo_map[0])
-    trailheads = []
-    for r in range(rows):
-        for c in range(cols):
-            if topo_map[r][c] == 0:
-                trailheads.append((r, c))
-    return trailheads
-
-
-def get_neighbors(pos, rows, cols):
-    """Get valid neighboring positions (up, down, left, right)."""
-    r, c = pos
-    neighbors = []
-    for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:  # up, down, left, right
-        new_r, new_c = r + dr, c + dc
-        if 0 <= new_r < rows and 0 <= new_c < cols:
-            neighbors.append((new_r, new_c))
-    return neighbors
+    return topo_map.find_all("0")
 
 
 def find_reachable_nines(topo_map, start):
     """Find all height-9 positions reachable via valid hiking trails from start."""
-    rows, cols = len(topo_map), len(topo_map[0])
     visited = set()
     reachable_nines = set()
     queue = deque([(start, {start})])  # (position, path)
 
     while queue:
         pos, path = queue.popleft()
-        r, c = pos
-        current_height = topo_map[r][c]
+        current_height = topo_map[pos]
 
-        if current_height == 9:
+        if current_height == SUMMIT:
             reachable_nines.add(pos)
             continue
 
-        for next_pos in get_neighbors(pos, rows, cols):
-            nr, nc = next_pos
-            next_height = topo_map[nr][nc]
+        for next_pos in topo_map.neighbors(pos):
+            next_height = topo_map[next_pos]
 
             # Check if it's a valid step (height increases by exactly 1)
             if next_height == current_height + 1 and next_pos not in path:
@@ -70,23 +62,33 @@ def calculate_total_score(topo_map):
     trailheads = find_trailheads(topo_map)
     total_score = 0
 
-    print(f"Found {len(trailheads)} trailheads")
+    logger.info("Found %d trailheads", len(trailheads))
     for i, trailhead in enumerate(trailheads, 1):
         score = find_reachable_nines(topo_map, trailhead)
-        print(f"Trailhead {i} at {trailhead}: score = {score}")
+        if logger.isEnabledFor(logging.DEBUG):
+            x, y = topo_map.coords(trailhead)
+            logger.debug("Trailhead %d at (%d, %d): score = %d", i, y, x, score)
         total_score += score
 
     return total_score
 
 
+def solve(filename):
+    """Solve part 1 for the given input file."""
+    with read_input(filename) as topo_map:
+        return calculate_total_score(topo_map)
+
+
 def main():
+    configure()
+
     # Read and process input
     print("Reading topographic map...")
-    topo_map = read_input("input.txt")
-    print(f"Map dimensions: {len(topo_map)}x{len(topo_map[0])}")
+    with read_input("day10/input.txt") as topo_map:
+        print(f"Map dimensions: {topo_map.height}x{topo_map.width}")
 
-    # Calculate total score
-    total_score = calculate_total_score(topo_map)
+        # Calculate total score
+        total_score = calculate_total_score(topo_map)
     print(f"\nTotal score: {total_score}")
 
 
@@ -1,7 +1,7 @@
 def read_input(filename="input.txt"):
     """Read the initial stone arrangement."""
     try:
-        with open(f"day11/{filename}", "r") as file:
+        with open(filename, "r") as file:
             return [int(x) for x in file.read().strip().split()]
     except FileNotFoundError:
         print(f"Error: {filename} not found.")
@@ -55,10 +55,15 @@ def simulate_blinks(stones, num_blinks):
     return current_stones
 
 
+def solve(filename):
+    """Solve part 1 for the given input file."""
+    return len(simulate_blinks(read_input(filename), 25))
+
+
 def main():
     # Test with example input first
     print("Testing with example input...")
-    stones = read_input("test_input.txt")
+    stones = read_input("day11/test_input.txt")
     print(f"Initial stones: {' '.join(map(str, stones))}")
     print(f"Initial number of stones: {len(stones)}")
 
@@ -69,7 +74,7 @@ def main():
 
     # Now process actual input
     print("\nProcessing actual input...")
-    stones = read_input("input.txt")
+    stones = read_input("day11/input.txt")
     print(f"Initial stones: {' '.join(map(str, stones))}")
     print(f"Initial number of stones: {len(stones)}")
 
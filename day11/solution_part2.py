@@ -5,7 +5,7 @@ from collections import Counter
 def read_input(filename="input.txt"):
     """Read the initial stone arrangement."""
     try:
-        with open(f"day11/{filename}", "r") as file:
+        with open(filename, "r") as file:
             # Store stones in a Counter for efficient counting and modification
             return Counter(int(x) for x in file.read().strip().split())
     except FileNotFoundError:
@@ -98,10 +98,16 @@ def simulate_blinks_fast(stones, num_blinks, verbose=True):
     return current_stones
 
 
+def solve(filename):
+    """Solve part 2 for the given input file."""
+    final_stones = simulate_blinks_fast(read_input(filename), 75, verbose=False)
+    return sum(final_stones.values())
+
+
 def main():
     # Test with example input first
     print("Testing with example input...")
-    stones = read_input("test_input.txt")
+    stones = read_input("day11/test_input.txt")
     print(f"Initial stones: {sum(stones.values())}")
 
     # Simulate 6 blinks for test
@@ -112,7 +118,7 @@ def main():
 
     # Now process actual input
     print("\nProcessing actual input...")
-    stones = read_input("input.txt")
+    stones = read_input("day11/input.txt")
     print(f"Initial stones: {sum(stones.values())}")
 
     # Simulate 75 blinks
@@ -1,47 +1,42 @@
+import logging
+import os
+import sys
 from collections import defaultdict, deque
 
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import Grid  # noqa: E402
+from aoc.log import configure  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
 
 def read_input(filename="input.txt"):
     """Read the garden map from input file."""
     try:
-        with open(f"day12/{filename}", "r") as file:
-            return [list(line.strip()) for line in file]
+        return Grid.from_file(filename)
     except FileNotFoundError:
         print(f"Error: {filename} not found.")
         exit(1)
 
 
-def get_neighbors(pos, rows, cols):
-    """Get valid neighboring positions (up, down, left, right)."""
-    r, c = pos
-    neighbors = []
-    for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:  # up, down, left, right
-        new_r, new_c = r + dr, c + dc
-        if 0 <= new_r < rows and 0 <= new_c < cols:
-            neighbors.append((new_r, new_c))
-    return neighbors
-
-
 def find_region(garden_map, start_pos, visited):
     """Find all positions in a region starting from start_pos."""
-    rows, cols = len(garden_map), len(garden_map[0])
-    plant_type = garden_map[start_pos[0]][start_pos[1]]
+    plant_type = garden_map[start_pos]
     region = set()
     queue = deque([start_pos])
 
     while queue:
         pos = queue.popleft()
-        if pos in visited or garden_map[pos[0]][pos[1]] != plant_type:
+        if pos in visited or garden_map[pos] != plant_type:
             continue
 
         region.add(pos)
         visited.add(pos)
 
-        for next_pos in get_neighbors(pos, rows, cols):
-            if (
-                next_pos not in visited
-                and garden_map[next_pos[0]][next_pos[1]] == plant_type
-            ):
+        for next_pos in garden_map.neighbors(pos):
+            if next_pos not in visited and garden_map[next_pos] == plant_type:
                 queue.append(next_pos)
 
     return region
@@ -49,23 +44,17 @@ def find_region(garden_map, start_pos, visited):
 
 def calculate_perimeter(garden_map, region):
     """Calculate the perimeter of a region."""
-    rows, cols = len(garden_map), len(garden_map[0])
     perimeter = 0
-    plant_type = garden_map[list(region)[0][0]][list(region)[0][1]]
+    size = len(garden_map)
+    plant_type = garden_map[next(iter(region))]
 
     for pos in region:
-        r, c = pos
         # Check each side
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            new_r, new_c = r + dr, c + dc
-            # Count edge if it's outside map or different plant type
-            if (
-                new_r < 0
-                or new_r >= rows
-                or new_c < 0
-                or new_c >= cols
-                or garden_map[new_r][new_c] != plant_type
-            ):
+        for offset in garden_map.orthogonal:
+            next_pos = pos + offset
+            # Count edge if it's outside map or different plant type (the
+            # row sentinel never matches a plant, so it counts as outside)
+            if not 0 <= next_pos < size or garden_map[next_pos] != plant_type:
                 perimeter += 1
 
     return perimeter
@@ -73,15 +62,13 @@ def calculate_perimeter(garden_map, region):
 
 def find_all_regions(garden_map):
     """Find all regions in the garden map."""
-    rows, cols = len(garden_map), len(garden_map[0])
     visited = set()
     regions = []
 
-    for r in range(rows):
-        for c in range(cols):
-            if (r, c) not in visited:
-                region = find_region(garden_map, (r, c), visited)
-                regions.append(region)
+    for pos in garden_map.cells():
+        if pos not in visited:
+            region = find_region(garden_map, pos, visited)
+            regions.append(region)
 
     return regions
 
@@ -90,7 +77,8 @@ def calculate_total_price(garden_map):
     """Calculate the total price of fencing all regions."""
     regions = find_all_regions(garden_map)
     total_price = 0
-    region_prices = defaultdict(list)  # For debugging
+    debug = logger.isEnabledFor(logging.DEBUG)
+    region_prices = defaultdict(list)  # Only filled when debugging
 
     for region in regions:
         area = len(region)
@@ -98,39 +86,52 @@ def calculate_total_price(garden_map):
         price = area * perimeter
         total_price += price
 
-        # Store region info for debugging
-        plant_type = garden_map[list(region)[0][0]][list(region)[0][1]]
-        region_prices[plant_type].append((area, perimeter, price))
-
-    # Print region details
-    print("\nRegion details:")
-    for plant_type, regions in sorted(region_prices.items()):
-        for i, (area, perimeter, price) in enumerate(regions, 1):
-            print(
-                f"Region {plant_type}{i}: area={area}, perimeter={perimeter}, price={price}"
-            )
+        if debug:
+            plant_type = chr(garden_map[next(iter(region))])
+            region_prices[plant_type].append((area, perimeter, price))
+
+    if debug:
+        logger.debug("Region details:")
+        for plant_type, regions in sorted(region_prices.items()):
+            for i, (area, perimeter, price) in enumerate(regions, 1):
+                logger.debug(
+                    "Region %s%d: area=%d, perimeter=%d, price=%d",
+                    plant_type,
+                    i,
+                    area,
+                    perimeter,
+                    price,
+                )
 
     return total_price
 
 
+def solve(filename):
+    """Solve part 1 for the given input file."""
+    with read_input(filename) as garden_map:
+        return calculate_total_price(garden_map)
+
+
 def main():
+    configure()
+
     # Test with example input first
     print("Testing with example input...")
-    garden_map = read_input("test_input.txt")
-    print(f"Map dimensions: {len(garden_map)}x{len(garden_map[0])}")
+    with read_input("day12/test_input.txt") as garden_map:
+        print(f"Map dimensions: {garden_map.height}x{garden_map.width}")
 
-    # Calculate total price for test
-    total_price = calculate_total_price(garden_map)
+        # Calculate total price for test
+        total_price = calculate_total_price(garden_map)
     print(f"\nTest total price of fencing: {total_price}")
     print("Expected price: 1930")
 
     # Now process actual input
     print("\nProcessing actual input...")
-    garden_map = read_input("input.txt")
-    print(f"Map dimensions: {len(garden_map)}x{len(garden_map[0])}")
+    with read_input("day12/input.txt") as garden_map:
+        print(f"Map dimensions: {garden_map.height}x{garden_map.width}")
 
-    # Calculate total price
-    total_price = calculate_total_price(garden_map)
+        # Calculate total price
+        total_price = calculate_total_price(garden_map)
     print(f"\nFinal total price of fencing: {total_price}")
 
 
@@ -51,6 +51,16 @@ def find_min_tokens(
     return None  # No solution found
 
 
+def solve(filename: str) -> int:
+    """Return the total tokens needed to win every winnable prize."""
+    total_tokens = 0
+    for button_a, button_b, prize in parse_input(filename):
+        tokens = find_min_tokens(button_a, button_b, prize)
+        if tokens is not None:
+            total_tokens += tokens
+    return total_tokens
+
+
 def main():
     machines = parse_input("day13/input.txt")
     total_tokens = 0
@@ -1,3 +1,21 @@
+import logging
+import os
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.log import configure  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+def log_grid(title, grid):
+    """Log the whole grid at debug level, building the dump only if enabled."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s\n%s", title, "\n".join("".join(row) for row in grid))
+
+
 def parse_input(file_path):
     with open(file_path, "r") as f:
         lines = f.readlines()
@@ -35,7 +53,7 @@ def try_move(grid, robot_pos, direction, move_char):
     x, y = robot_pos
     dx, dy = direction
 
-    print(f"\nAttempting move {move_char} from position ({x}, {y})")
+    logger.debug("Attempting move %s from position (%d, %d)", move_char, x, y)
 
     # Calculate new position
     new_x = x + dx
@@ -43,7 +61,7 @@ def try_move(grid, robot_pos, direction, move_char):
 
     # Check if hitting wall
     if grid[new_y][new_x] == "#":
-        print(f"Hit wall at ({new_x}, {new_y}), no movement")
+        logger.debug("Hit wall at (%d, %d), no movement", new_x, new_y)
         return grid, robot_pos
 
     # Check if pushing box(es)
@@ -63,8 +81,11 @@ def try_move(grid, robot_pos, direction, move_char):
 
         # Check if the chain of boxes can be pushed (needs empty space at the end)
         if grid[check_y][check_x] != ".":
-            print(
-                f"Cannot push boxes - blocked by {grid[check_y][check_x]} at ({check_x}, {check_y})"
+            logger.debug(
+                "Cannot push boxes - blocked by %s at (%d, %d)",
+                grid[check_y][check_x],
+                check_x,
+                check_y,
             )
             return grid, robot_pos
 
@@ -81,24 +102,30 @@ def try_move(grid, robot_pos, direction, move_char):
             new_box_x = box_x + dx
             new_box_y = box_y + dy
             new_grid[new_box_y][new_box_x] = "O"  # Place box in new position
-            print(f"Pushed box from ({box_x}, {box_y}) to ({new_box_x}, {new_box_y})")
+            logger.debug(
+                "Pushed box from (%d, %d) to (%d, %d)",
+                box_x,
+                box_y,
+                new_box_x,
+                new_box_y,
+            )
 
         # Place robot in the first box's old position
         new_grid[new_y][new_x] = "@"
-        print(f"Robot moved to ({new_x}, {new_y})")
+        logger.debug("Robot moved to (%d, %d)", new_x, new_y)
         return ["".join(row) for row in new_grid], (new_x, new_y)
 
     # Simple move without pushing
     new_grid = [list(row) for row in grid]
     new_grid[y][x] = "."
     new_grid[new_y][new_x] = "@"
-    print(f"Simple move to ({new_x}, {new_y})")
+    logger.debug("Simple move to (%d, %d)", new_x, new_y)
     return ["".join(row) for row in new_grid], (new_x, new_y)
 
 
 def calculate_gps_coordinates(grid):
     total = 0
-    print("\nCalculating GPS coordinates:")
+    logger.debug("Calculating GPS coordinates:")
     for y in range(len(grid)):
         for x in range(len(grid[0])):
             if grid[y][x] == "O":
@@ -107,8 +134,13 @@ def calculate_gps_coordinates(grid):
                 # Distance from top = y (count: edge→wall→position)
                 # Distance from left = x (count: edge→wall→position)
                 gps = 100 * y + x
-                print(
-                    f"Box at ({x}, {y}) -> distance from top: {y}, from left: {x}, GPS: {gps}"
+                logger.debug(
+                    "Box at (%d, %d) -> distance from top: %d, from left: %d, GPS: %d",
+                    x,
+                    y,
+                    y,
+                    x,
+                    gps,
                 )
                 total += gps
     return total
@@ -133,28 +165,20 @@ def solve(input_file, test_mode=False):
         grid, moves = parse_input(input_file)
 
     robot_pos = find_robot_position(grid)
-    print(f"\nInitial robot position: {robot_pos}")
+    logger.debug("Initial robot position: %s", robot_pos)
 
     # Direction mappings
     directions = {"^": (0, -1), "v": (0, 1), "<": (-1, 0), ">": (1, 0)}
 
-    # Debug: Print initial state
-    print("\nInitial state:")
-    for row in grid:
-        print(row)
+    log_grid("Initial state:", grid)
 
     # Process each move
     for move in moves:
         if move in directions:
             grid, robot_pos = try_move(grid, robot_pos, directions[move], move)
-            print("\nCurrent state:")
-            for row in grid:
-                print(row)
+            log_grid("Current state:", grid)
 
-    # Debug: Print final state
-    print("\nFinal state:")
-    for row in grid:
-        print(row)
+    log_grid("Final state:", grid)
 
     # Calculate final GPS coordinates
     result = calculate_gps_coordinates(grid)
@@ -170,6 +194,8 @@ def solve(input_file, test_mode=False):
 def main():
     import argparse
 
+    configure()
+
     parser = argparse.ArgumentParser()
     parser.add_argument("--test", action="store_true", help="Run with test input")
     args = parser.parse_args()
@@ -90,6 +90,11 @@ def run_program(filename: str) -> str:
     return ",".join(str(x) for x in output)
 
 
+def solve(filename: str) -> str:
+    """Solve part 1 for the given input file."""
+    return run_program(filename)
+
+
 def test_examples():
     """Test the example cases from the problem."""
     # Test case 1: If register C contains 9, the program 2,6 would set register B to 1
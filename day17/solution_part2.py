@@ -88,6 +88,22 @@ def simulate_program(initial_a, program, debug=False):
     return outputs, execution_path
 
 
+def find_matching_value(initial_a, program, limit=1000000):
+    """Find the smallest A below limit reproducing the outputs and path of initial_a."""
+    target_outputs, target_path = simulate_program(initial_a, program)
+    for test_value in range(1, limit):
+        outputs, path = simulate_program(test_value, program)
+        if outputs == target_outputs and path == target_path:
+            return test_value
+    return None
+
+
+def solve(filename):
+    """Solve part 2 for the given input file."""
+    initial_a, program = read_input(filename)
+    return find_matching_value(initial_a, program)
+
+
 def main():
     global program  # Make program accessible to try_values
     # Read the program and initial A value
@@ -102,23 +118,22 @@ def main():
     print(f"Target execution path: {target_path}")
 
     # Try to find a smaller value that produces the same outputs AND follows the same path
-    for test_value in range(1, 1000000):  # Try values up to 1M
-        outputs, path = simulate_program(test_value, program)
-        if outputs == target_outputs and path == target_path:
-            print(f"\nFound smaller value: {test_value}")
-            print(f"Binary representation: {bin(test_value)[2:]}")
-
-            # Verify this value
-            print("\nVerifying solution:")
-            outputs, path = simulate_program(test_value, program, debug=True)
-            print(f"\nResults:")
-            print(f"Program outputs: {outputs}")
-            print(f"Target outputs: {target_outputs}")
-            print(f"Execution path matches: {path == target_path}")
-            print(
-                f"Solution is correct: {outputs == target_outputs and path == target_path}"
-            )
-            return
+    test_value = find_matching_value(initial_a, program)
+    if test_value is not None:
+        print(f"\nFound smaller value: {test_value}")
+        print(f"Binary representation: {bin(test_value)[2:]}")
+
+        # Verify this value
+        print("\nVerifying solution:")
+        outputs, path = simulate_program(test_value, program, debug=True)
+        print(f"\nResults:")
+        print(f"Program outputs: {outputs}")
+        print(f"Target outputs: {target_outputs}")
+        print(f"Execution path matches: {path == target_path}")
+        print(
+            f"Solution is correct: {outputs == target_outputs and path == target_path}"
+        )
+        return
 
     print("\nNo smaller value found!")
 
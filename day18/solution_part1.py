@@ -1,6 +1,15 @@
+import os
+import sys
 from collections import deque
 import heapq
 
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import Grid  # noqa: E402
+
+WALL = ord("#")
+
 
 def parse_input(file_path):
     coordinates = []
@@ -12,55 +21,51 @@ def parse_input(file_path):
 
 
 def create_grid(coordinates, max_size=71):
-    grid = [["."] * max_size for _ in range(max_size)]
+    grid = Grid.blank(max_size, max_size)
     for x, y in coordinates:
-        grid[y][x] = "#"
+        grid[grid.index(x, y)] = WALL
     return grid
 
 
 def print_grid(grid):
-    for row in grid:
-        print("".join(row))
+    for y in range(grid.height):
+        print(grid.row(y).decode())
 
 
 def find_shortest_path(grid):
-    rows, cols = len(grid), len(grid[0])
-    start = (0, 0)
-    end = (cols - 1, rows - 1)
+    start = grid.index(0, 0)
+    end = grid.index(grid.width - 1, grid.height - 1)
 
     # Priority queue for Dijkstra's algorithm
-    # Format: (distance, (x, y))
+    # Format: (distance, cell index)
     pq = [(0, start)]
     visited = set()
 
-    # Possible directions: right, down, left, up
-    directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-
     while pq:
-        dist, (x, y) = heapq.heappop(pq)
+        dist, pos = heapq.heappop(pq)
 
-        if (x, y) == end:
+        if pos == end:
             return dist
 
-        if (x, y) in visited:
+        if pos in visited:
             continue
 
-        visited.add((x, y))
+        visited.add(pos)
 
-        for dx, dy in directions:
-            new_x, new_y = x + dx, y + dy
-
-            if (
-                0 <= new_x < cols
-                and 0 <= new_y < rows
-                and grid[new_y][new_x] != "#"
-                and (new_x, new_y) not in visited
-            ):
-                heapq.heappush(pq, (dist + 1, (new_x, new_y)))
+        for neighbor in grid.neighbors(pos):
+            if grid[neighbor] != WALL and neighbor not in visited:
+                heapq.heappush(pq, (dist + 1, neighbor))
 
     return float("inf")  # No path found
 
 
+def solve(file_path, max_size=71, num_bytes=1024):
+    """Solve part 1 for the given input file."""
+    # Take only the first num_bytes bytes as specified
+    coordinates = parse_input(file_path)[:num_bytes]
+    return find_shortest_path(create_grid(coordinates, max_size))
+
+
 def solve_example():
     example_input = """5,4
 4,2
@@ -93,11 +98,7 @@ def main():
 
     # Then solve the actual input
     print("Solving actual input...")
-    coordinates = parse_input("day18/input.txt")
-    # Take only first 1024 bytes as specified
-    coordinates = coordinates[:1024]
-    grid = create_grid(coordinates)
-    steps = find_shortest_path(grid)
+    steps = solve("day18/input.txt")
     print(f"Solution: {steps} steps")
 
 
@@ -1,5 +1,14 @@
+import os
+import sys
 from collections import deque
-import heapq
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import Grid  # noqa: E402
+
+WALL = ord("#")
+OPEN = ord(".")
 
 
 def parse_input(file_path):
@@ -12,60 +21,58 @@ def parse_input(file_path):
 
 
 def create_grid(coordinates, max_size=71):
-    grid = [["."] * max_size for _ in range(max_size)]
+    grid = Grid.blank(max_size, max_size)
     for x, y in coordinates:
-        grid[y][x] = "#"
+        grid[grid.index(x, y)] = WALL
     return grid
 
 
 def print_grid(grid):
-    for row in grid:
-        print("".join(row))
+    for y in range(grid.height):
+        print(grid.row(y).decode())
 
 
 def has_path_to_exit(grid):
-    rows, cols = len(grid), len(grid[0])
-    start = (0, 0)
-    end = (cols - 1, rows - 1)
+    start = grid.index(0, 0)
+    end = grid.index(grid.width - 1, grid.height - 1)
+    data, size, directions = grid.data, grid.size, grid.orthogonal
 
     # If start or end is blocked, no path exists
-    if grid[start[1]][start[0]] == "#" or grid[end[1]][end[0]] == "#":
+    if data[start] == WALL or data[end] == WALL:
         return False
 
-    # Use BFS for faster path existence check
+    # Use BFS for faster path existence check; walls and the newline
+    # sentinels are the only cells that are not open
     queue = deque([start])
-    visited = {start}
-
-    directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+    visited = bytearray(size)
+    visited[start] = 1
 
     while queue:
-        x, y = queue.popleft()
+        pos = queue.popleft()
 
-        if (x, y) == end:
+        if pos == end:
             return True
 
-        for dx, dy in directions:
-            new_x, new_y = x + dx, y + dy
-
+        for offset in directions:
+            neighbor = pos + offset
             if (
-                0 <= new_x < cols
-                and 0 <= new_y < rows
-                and grid[new_y][new_x] != "#"
-                and (new_x, new_y) not in visited
+                0 <= neighbor < size
+                and data[neighbor] == OPEN
+                and not visited[neighbor]
             ):
-                queue.append((new_x, new_y))
-                visited.add((new_x, new_y))
+                queue.append(neighbor)
+                visited[neighbor] = 1
 
     return False
 
 
 def find_blocking_coordinate(coordinates, max_size=71):
-    grid = [["."] * max_size for _ in range(max_size)]
+    grid = Grid.blank(max_size, max_size)
 
     # Process coordinates one by one
     for i, (x, y) in enumerate(coordinates):
         # Add the current byte
-        grid[y][x] = "#"
+        grid[grid.index(x, y)] = WALL
 
         # Check if path still exists
         if not has_path_to_exit(grid):
@@ -74,6 +81,14 @@ def find_blocking_coordinate(coordinates, max_size=71):
     return None
 
 
+def solve(file_path, max_size=71):
+    """Solve part 2 for the given input file."""
+    blocking_coord = find_blocking_coordinate(parse_input(file_path), max_size)
+    if blocking_coord is None:
+        return None
+    return f"{blocking_coord[0]},{blocking_coord[1]}"
+
+
 def solve_example():
     example_input = """5,4
 4,2
@@ -105,9 +120,7 @@ def main():
 
     # Then solve the actual input
     print("\nSolving actual input...")
-    coordinates = parse_input("day18/input.txt")
-    blocking_coord = find_blocking_coordinate(coordinates)
-    print(f"Solution: {blocking_coord[0]},{blocking_coord[1]}")
+    print(f"Solution: {solve('day18/input.txt')}")
 
 
 if __name__ == "__main__":
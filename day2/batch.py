@@ -0,0 +1,94 @@
+"""Vectorized day 2 safety checks over every report at once.
+
+All reports are packed into one ragged array (see aoc.arrays): values holds
+every level of every report back to back, and report r is
+values[offsets[r] : offsets[r + 1]]. Differences and the
+increasing/decreasing masks are then computed for the whole batch with
+numpy and reduced per report, so there is no per-report Python work.
+"""
+
+from aoc.arrays import NUMPY_AVAILABLE, np, parse_rows  # noqa: F401
+
+
+def read_reports(filename="input.txt"):
+    """Read the input file into (values, offsets) arrays."""
+    try:
+        with open(filename, "rb") as file:
+            return parse_rows(file.read())
+    except FileNotFoundError:
+        print(f"Error: {filename} not found. Please create an input file.")
+        exit(1)
+
+
+def _layout(values, offsets):
+    """Per level: report index, position inside it and that report's length."""
+    lengths = np.diff(offsets)
+    report = np.repeat(np.arange(len(lengths)), lengths)
+    position = np.arange(len(values)) - offsets[report]
+    return lengths, report, position
+
+
+def _in_range(diffs, increasing):
+    return (diffs >= 1) & (diffs <= 3) if increasing else (diffs >= -3) & (diffs <= -1)
+
+
+def _bad_steps(values, lengths, report, position, increasing):
+    """Per level, 1 if the step to the next level of its report is unsafe."""
+    diffs = np.diff(values, append=0)
+    has_next = position < lengths[report] - 1
+    return (has_next & ~_in_range(diffs, increasing)).astype(np.int64)
+
+
+def safe_mask(values, offsets):
+    """Boolean array telling which reports are safe."""
+    lengths, report, position = _layout(values, offsets)
+    safe = np.zeros(len(lengths), dtype=bool)
+    for increasing in (True, False):
+        bad = _bad_steps(values, lengths, report, position, increasing)
+        bad_per_report = np.bincount(report, weights=bad, minlength=len(lengths))
+        safe |= bad_per_report == 0
+    return safe & (lengths >= 2)
+
+
+def dampened_safe_mask(values, offsets):
+    """Boolean array telling which reports are safe with one level removed.
+
+    Removing level t drops its two steps t - 1 -> t and t -> t + 1 and adds
+    the merged step t - 1 -> t + 1. The report is then safe when no other
+    step is bad and the merged one is in range, which is checked for every
+    level of every report at once.
+    """
+    lengths, report, position = _layout(values, offsets)
+    has_previous = position > 0
+    has_next = position < lengths[report] - 1
+    # Removing a level has to leave at least two levels
+    long_enough = lengths[report] >= 3
+
+    # values[t + 1] - values[t - 1], only meaningful for inner levels
+    merged = np.zeros(len(values), dtype=np.int64)
+    merged[1:-1] = values[2:] - values[:-2]
+
+    safe = safe_mask(values, offsets)
+    for increasing in (True, False):
+        bad = _bad_steps(values, lengths, report, position, increasing)
+        bad_per_report = np.bincount(report, weights=bad, minlength=len(lengths))
+
+        bad_before = np.zeros(len(values), dtype=np.int64)
+        bad_before[1:] = bad[:-1]
+        removed = bad_before * has_previous + bad * has_next
+        inner = has_previous & has_next
+        merged_ok = ~inner | _in_range(merged, increasing)
+
+        ok = (bad_per_report[report] - removed == 0) & merged_ok & long_enough
+        safe |= np.bincount(report, weights=ok, minlength=len(lengths)) > 0
+    return safe
+
+
+def count_safe(values, offsets) -> int:
+    """Count how many packed reports are safe."""
+    return int(safe_mask(values, offsets).sum())
+
+
+def count_safe_with_dampener(values, offsets) -> int:
+    """Count how many packed reports are safe with the Problem Dampener."""
+    return int(dampened_safe_mask(values, offsets).sum())
@@ -0,0 +1,122 @@
+"""Streaming day 2 safety counts over report logs of any size.
+
+The file is read lazily in chunks of whole lines and each chunk is checked
+in a worker process, with both the plain and the dampened safety count
+coming from the same pass. Only a bounded number of chunks are in flight at
+a time, so memory stays constant however big the log is, while throughput
+scales with the number of workers.
+"""
+
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+from aoc.pool import module_pool
+from batch import NUMPY_AVAILABLE, dampened_safe_mask, parse_rows, safe_mask
+
+DEFAULT_CHUNK_SIZE = 4 << 20  # bytes of reports per task
+IN_FLIGHT_PER_WORKER = 2
+
+
+@dataclass
+class ChunkStats:
+    """Counts and timing for one chunk of reports."""
+
+    index: int
+    size: int  # bytes
+    reports: int = 0
+    levels: int = 0
+    safe: int = 0
+    dampened_safe: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class StreamResult:
+    """Safe and dampened-safe totals, with the stats of every chunk."""
+
+    safe: int = 0
+    dampened_safe: int = 0
+    chunks: List[ChunkStats] = field(default_factory=list)
+
+
+def read_report_chunks(
+    filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yield the file in pieces of about chunk_size bytes, cut at line ends."""
+    try:
+        file = open(filename, "rb")
+    except FileNotFoundError:
+        print(f"Error: {filename} not found. Please create an input file.")
+        exit(1)
+
+    with file:
+        remainder = b""
+        while True:
+            block = file.read(chunk_size)
+            if not block:
+                break
+            cut = block.rfind(b"\n") + 1
+            if not cut:
+                remainder += block
+                continue
+            yield remainder + block[:cut]
+            remainder = block[cut:]
+        if remainder:
+            yield remainder
+
+
+def check_chunk(index: int, chunk: bytes) -> ChunkStats:
+    """Count the safe reports in one chunk."""
+    stats = ChunkStats(index, len(chunk))
+    start = time.perf_counter()
+    if NUMPY_AVAILABLE:
+        values, offsets = parse_rows(chunk)
+        stats.reports = len(offsets) - 1
+        stats.levels = len(values)
+        stats.safe = int(safe_mask(values, offsets).sum())
+        stats.dampened_safe = int(dampened_safe_mask(values, offsets).sum())
+    else:
+        from solution_part2 import is_safe_report, is_safe_with_dampener
+
+        for line in chunk.splitlines():
+            levels = list(map(int, line.split()))
+            stats.reports += 1
+            stats.levels += len(levels)
+            stats.safe += is_safe_report(levels)
+            stats.dampened_safe += is_safe_with_dampener(levels)
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def count_safe_streaming(
+    filename: str,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> StreamResult:
+    """Safe and dampened-safe counts of a report log, checked in parallel."""
+    result = StreamResult()
+
+    def collect(stats: ChunkStats):
+        result.safe += stats.safe
+        result.dampened_safe += stats.dampened_safe
+        result.chunks.append(stats)
+
+    chunks = read_report_chunks(filename, chunk_size)
+    if workers == 1:
+        for index, chunk in enumerate(chunks):
+            collect(check_chunk(index, chunk))
+        return result
+
+    workers = workers or os.cpu_count() or 1
+    with module_pool(check_chunk, workers) as pool:
+        pending = deque()
+        for index, chunk in enumerate(chunks):
+            pending.append(pool.submit(check_chunk, index, chunk))
+            if len(pending) >= workers * IN_FLIGHT_PER_WORKER:
+                collect(pending.popleft().result())
+        while pending:
+            collect(pending.popleft().result())
+    return result
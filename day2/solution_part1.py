@@ -1,3 +1,13 @@
+import os
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch import NUMPY_AVAILABLE, count_safe, read_reports  # noqa: E402
+from report_stream import count_safe_streaming  # noqa: E402
+
+
 def read_input(filename="input.txt"):
     """Read the input file and return list of level reports."""
     reports = []
@@ -49,12 +59,22 @@ def count_safe_reports(reports):
     return sum(1 for report in reports if is_safe_report(report))
 
 
-def main():
-    # Read input with a specific file path
-    reports = read_input("day2/input.txt")
+def solve(filename, streaming=False):
+    """Solve part 1 for the given input file.
+
+    With streaming=True the file is checked chunk by chunk in a process pool
+    instead of being loaded whole.
+    """
+    if streaming:
+        return count_safe_streaming(filename).safe
+    if NUMPY_AVAILABLE:
+        return count_safe(*read_reports(filename))
+    return count_safe_reports(read_input(filename))
 
+
+def main():
     # Calculate and print result
-    result = count_safe_reports(reports)
+    result = solve("day2/input.txt")
     print(f"Number of safe reports: {result}")
 
 
@@ -1,3 +1,13 @@
+import os
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch import NUMPY_AVAILABLE, count_safe_with_dampener, read_reports  # noqa: E402
+from report_stream import count_safe_streaming  # noqa: E402
+
+
 def read_input(filename="input.txt"):
     """Read the input file and return list of level reports."""
     reports = []
@@ -44,33 +54,69 @@ def is_safe_report(levels):
     return True
 
 
-def is_safe_with_dampener(levels):
-    """Check if a report is safe, considering the Problem Dampener."""
+def count_removals(levels, increasing, max_removals):
+    """Fewest levels to remove so the rest all step the same way by 1 to 3.
+
+    cost[j] is the fewest removals that make levels[: j + 1] safe while
+    keeping level j. The previous kept level can be at most max_removals + 1
+    back, so each level only looks at that window and the whole check is
+    O(n * max_removals) with no list copies.
+    """
+    low, high = (1, 3) if increasing else (-3, -1)
+    cost = []
+    for j, level in enumerate(levels):
+        best = j  # remove everything before j
+        for p in range(max(0, j - max_removals - 1), j):
+            if low <= level - levels[p] <= high:
+                best = min(best, cost[p] + j - p - 1)
+        cost.append(best)
+
+    # Remove everything after the last kept level
+    last = len(levels) - 1
+    return min((c + last - j for j, c in enumerate(cost)), default=0)
+
+
+def is_safe_with_dampener(levels, max_removals=1):
+    """Check if a report is safe after removing up to max_removals levels."""
     # First check if it's safe without removing any level
     if is_safe_report(levels):
         return True
 
-    # Try removing each level one at a time
-    for i in range(len(levels)):
-        # Create a new list without the current level
-        dampened_levels = levels[:i] + levels[i + 1 :]
-        if is_safe_report(dampened_levels):
+    for increasing in (True, False):
+        removals = count_removals(levels, increasing, max_removals)
+        # A safe report still needs at least two levels
+        if removals <= max_removals and len(levels) - removals >= 2:
             return True
 
     return False
 
 
-def count_safe_reports_with_dampener(reports):
+def count_safe_reports_with_dampener(reports, max_removals=1):
     """Count how many reports are safe with the Problem Dampener."""
-    return sum(1 for report in reports if is_safe_with_dampener(report))
+    return sum(1 for report in reports if is_safe_with_dampener(report, max_removals))
 
 
-def main():
-    # Read input with a specific file path
-    reports = read_input("day2/input.txt")
+def solve(filename, max_removals=1, streaming=False):
+    """Solve part 2 for the given input file.
 
+    With streaming=True the file is checked chunk by chunk in a process pool
+    instead of being loaded whole. Streaming supports a single removal only
+    and raises ValueError for any other max_removals.
+    """
+    if streaming:
+        if max_removals != 1:
+            raise ValueError(
+                f"streaming supports max_removals=1, got max_removals={max_removals}"
+            )
+        return count_safe_streaming(filename).dampened_safe
+    if NUMPY_AVAILABLE and max_removals == 1:
+        return count_safe_with_dampener(*read_reports(filename))
+    return count_safe_reports_with_dampener(read_input(filename), max_removals)
+
+
+def main():
     # Calculate and print result
-    result = count_safe_reports_with_dampener(reports)
+    result = solve("day2/input.txt")
     print(f"Number of safe reports with Problem Dampener: {result}")
 
 
@@ -0,0 +1,74 @@
+import os
+import random
+import sys
+import tempfile
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch import (  # noqa: E402
+    NUMPY_AVAILABLE,
+    count_safe,
+    count_safe_with_dampener,
+    read_reports,
+)
+from report_stream import count_safe_streaming  # noqa: E402
+from solution_part1 import count_safe_reports, read_input  # noqa: E402
+from solution_part2 import count_safe_reports_with_dampener  # noqa: E402
+
+
+def random_reports(rng, reports=500, low=-30, high=30):
+    """Reports of 1 to 8 levels around zero, mostly small steps so that a
+    fair share of them are safe, some with one bad step."""
+    lines = []
+    for _ in range(reports):
+        level = rng.randint(low, high)
+        direction = rng.choice([-1, 1])
+        levels = [level]
+        for _ in range(rng.randint(0, 7)):
+            step = direction * rng.randint(1, 3)
+            if rng.random() < 0.1:
+                step = rng.choice([0, 4, -direction])
+            level += step
+            levels.append(level)
+        lines.append(" ".join(map(str, levels)))
+    return "\n".join(lines) + "\n"
+
+
+def all_counts(path):
+    """(part 1, part 2) from every day 2 path, by name."""
+    reports = read_input(path)
+    counts = {
+        "list": (count_safe_reports(reports), count_safe_reports_with_dampener(reports))
+    }
+    if NUMPY_AVAILABLE:
+        values, offsets = read_reports(path)
+        counts["batch"] = (
+            count_safe(values, offsets),
+            count_safe_with_dampener(values, offsets),
+        )
+        streamed = count_safe_streaming(path, workers=1, chunk_size=1024)
+        counts["streaming"] = (streamed.safe, streamed.dampened_safe)
+    return counts
+
+
+def verify_paths(cases=20, seed=2024):
+    """Check that all paths agree on random reports with negative levels."""
+    rng = random.Random(seed)
+    failed = 0
+    with tempfile.TemporaryDirectory(prefix="day2-") as directory:
+        path = os.path.join(directory, "reports.txt")
+        for case in range(cases):
+            with open(path, "w") as file:
+                file.write(random_reports(rng))
+            counts = all_counts(path)
+            if len(set(counts.values())) != 1:
+                failed += 1
+                print(f"Case {case}: {counts}")
+
+    print(f"{cases - failed}/{cases} cases agree across {', '.join(counts)}")
+    return not failed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_paths() else 1)
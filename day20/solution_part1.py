@@ -1,53 +1,33 @@
+import os
+import sys
 from collections import deque
 from typing import List, Tuple, Set, Dict
 
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-def parse_input(
-    filename: str,
-) -> Tuple[List[List[str]], Tuple[int, int], Tuple[int, int]]:
-    grid = []
-    start = None
-    end = None
-
-    with open(filename) as f:
-        for i, line in enumerate(f):
-            row = list(line.strip())
-            for j, char in enumerate(row):
-                if char == "S":
-                    start = (i, j)
-                    row[j] = "."
-                elif char == "E":
-                    end = (i, j)
-                    row[j] = "."
-            grid.append(row)
+from aoc.grid import Grid  # noqa: E402
+
+TRACK = ord(".")
 
-    return grid, start, end
 
+def parse_input(filename: str) -> Tuple[Grid, int, int]:
+    grid = Grid.from_file(filename, writable=True)
+    start = grid.find("S")
+    end = grid.find("E")
+    grid[start] = TRACK
+    grid[end] = TRACK
 
-def get_neighbors(
-    pos: Tuple[int, int], grid: List[List[str]], allow_walls: bool = False
-) -> List[Tuple[int, int]]:
-    directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-    r, c = pos
-    neighbors = []
+    return grid, start, end
 
-    for dr, dc in directions:
-        new_r, new_c = r + dr, c + dc
-        if (
-            0 <= new_r < len(grid)
-            and 0 <= new_c < len(grid[0])
-            and (
-                grid[new_r][new_c] == "." or (allow_walls and grid[new_r][new_c] == "#")
-            )
-        ):
-            neighbors.append((new_r, new_c))
 
-    return neighbors
+def get_neighbors(pos: int, grid: Grid, allow_walls: bool = False) -> List[int]:
+    if allow_walls:
+        return list(grid.neighbors(pos))
+    return [n for n in grid.neighbors(pos) if grid[n] == TRACK]
 
 
-def bfs_distances(
-    grid: List[List[str]], start: Tuple[int, int]
-) -> Dict[Tuple[int, int], int]:
+def bfs_distances(grid: Grid, start: int) -> Dict[int, int]:
     """Calculate distances from start to all reachable points using BFS"""
     distances = {start: 0}
     queue = deque([start])
@@ -62,31 +42,27 @@ def bfs_distances(
     return distances
 
 
-def get_valid_cheat_paths(
-    pos: Tuple[int, int], grid: List[List[str]], max_steps: int = 2
-) -> Set[Tuple[int, int]]:
+def get_valid_cheat_paths(pos: int, grid: Grid, max_steps: int = 2) -> Set[int]:
     """Find all valid positions reachable within max_steps, allowing wall passing"""
     valid_ends = set()
     queue = deque([(pos, 0)])  # (position, steps)
     seen = {pos}
 
     while queue:
-        (r, c), steps = queue.popleft()
-        if steps > 0 and grid[r][c] == ".":
-            valid_ends.add((r, c))
+        current, steps = queue.popleft()
+        if steps > 0 and grid[current] == TRACK:
+            valid_ends.add(current)
 
         if steps < max_steps:
-            for new_r, new_c in get_neighbors((r, c), grid, allow_walls=True):
-                if (new_r, new_c) not in seen:
-                    seen.add((new_r, new_c))
-                    queue.append(((new_r, new_c), steps + 1))
+            for next_pos in get_neighbors(current, grid, allow_walls=True):
+                if next_pos not in seen:
+                    seen.add(next_pos)
+                    queue.append((next_pos, steps + 1))
 
     return valid_ends
 
 
-def find_cheats(
-    grid: List[List[str]], start: Tuple[int, int], end: Tuple[int, int]
-) -> int:
+def find_cheats(grid: Grid, start: int, end: int) -> int:
     # Calculate distances from start and end to all reachable points
     forward_distances = bfs_distances(grid, start)
     backward_distances = bfs_distances(grid, end)
@@ -95,7 +71,6 @@ def find_cheats(
         return 0  # No path exists
 
     normal_dist = forward_distances[end]
-    rows, cols = len(grid), len(grid[0])
     cheats_100plus = set()  # Use set to avoid duplicates
 
     # For each reachable point, try it as a cheat start position
@@ -104,16 +79,15 @@ def find_cheats(
         cheat_ends = get_valid_cheat_paths(cheat_start, grid)
 
         # For each valid end position
+        start_x, start_y = grid.coords(cheat_start)
         for cheat_end in cheat_ends:
             # Check if we can reach the final destination from here
             if cheat_end in backward_distances:
+                end_x, end_y = grid.coords(cheat_end)
                 # Calculate total distance with this cheat
                 cheat_dist = (
                     forward_distances[cheat_start]  # Distance to cheat start
-                    + (
-                        abs(cheat_end[0] - cheat_start[0])
-                        + abs(cheat_end[1] - cheat_start[1])
-                    )  # Cheat distance
+                    + (abs(end_x - start_x) + abs(end_y - start_y))  # Cheat distance
                     + backward_distances[cheat_end]  # Distance from cheat end to finish
                 )
 
@@ -126,9 +100,15 @@ def find_cheats(
     return len(cheats_100plus)
 
 
+def solve(filename: str) -> int:
+    """Solve part 1 for the given input file."""
+    grid, start, end = parse_input(filename)
+    with grid:
+        return find_cheats(grid, start, end)
+
+
 def main():
-    grid, start, end = parse_input("day20/input.txt")
-    result = find_cheats(grid, start, end)
+    result = solve("day20/input.txt")
     print(f"Number of cheats saving at least 100 picoseconds: {result}")
 
 
@@ -0,0 +1,82 @@
+"""Constant-memory day 3 scanning of corrupted memory dumps.
+
+The dump is read in fixed-size chunks. An instruction can be cut in half by
+a chunk edge, so the last MAX_TOKEN - 1 bytes of each chunk are only scanned
+once the next chunk is appended to them. Every instruction is at most
+MAX_TOKEN bytes long, so any instruction starting before that tail is
+complete. The do()/don't()
+state is carried from chunk to chunk.
+"""
+
+import re
+from typing import Iterable, Iterator, Tuple
+
+# Same tokenizer as solution_part2, over bytes so it also runs on an mmap
+INSTRUCTION = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|(do\(\))|(don't\(\))")
+DO_GROUP = 3
+DONT_GROUP = 4
+MAX_TOKEN = len(b"mul(999,999)")
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def scan(buffer, enabled=True, use_controls=True, end=None) -> Tuple[int, bool, int]:
+    """Sum the enabled mul instructions in buffer.
+
+    Only instructions starting before end (default: anywhere) are used.
+    Returns (total, enabled state afterwards, offset where scanning stopped),
+    where the offset is the end of the last instruction used or end itself.
+    """
+    limit = len(buffer) if end is None else end
+    total = 0
+    stop = 0
+    for match in INSTRUCTION.finditer(buffer):
+        if match.start() >= limit:
+            break
+        kind = match.lastindex
+        if kind == DO_GROUP or kind == DONT_GROUP:
+            if use_controls:
+                enabled = kind == DO_GROUP
+        elif enabled:
+            total += int(match.group(1)) * int(match.group(2))
+        stop = match.end()
+    return total, enabled, max(stop, limit)
+
+
+def scan_chunks(
+    chunks: Iterable[bytes], enabled=True, use_controls=True
+) -> Tuple[int, bool]:
+    """Sum the enabled mul instructions over consecutive chunks of one dump."""
+    total = 0
+    carry = b""
+    for chunk in chunks:
+        buffer = carry + chunk
+        # Instructions starting in the last MAX_TOKEN - 1 bytes may be cut off
+        part, enabled, stop = scan(
+            buffer, enabled, use_controls, end=max(0, len(buffer) - MAX_TOKEN + 1)
+        )
+        total += part
+        carry = buffer[stop:]
+    part, enabled, _ = scan(carry, enabled, use_controls)
+    return total + part, enabled
+
+
+def read_chunks(filename, chunk_size=DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the file chunk_size bytes at a time."""
+    with open(filename, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def sum_file(filename, use_controls=True, chunk_size=DEFAULT_CHUNK_SIZE) -> int:
+    """Sum of the enabled mul instructions in a dump, in constant memory.
+
+    With use_controls=False do() and don't() are ignored, as in part 1.
+    """
+    try:
+        return scan_chunks(read_chunks(filename, chunk_size), True, use_controls)[0]
+    except FileNotFoundError:
+        print(f"Error: {filename} not found. Please create an input file.")
+        exit(1)
@@ -0,0 +1,126 @@
+"""Parallel day 3 scanning of a dump split into byte-range shards.
+
+Whether a mul counts depends on the last do()/don't() before it, which a
+shard can't know on its own. A shard is summed once for both possible
+starting states instead: muls before its first control instruction count
+only if the shard starts enabled, and everything after that control is
+decided inside the shard. Each worker returns
+
+    (sum if starting enabled, sum if starting disabled, final state, saw control)
+
+and a prefix pass over the shards in order picks the right sum for each and
+carries the state forward, which gives the exact sequential total.
+
+An instruction belongs to the shard it starts in. Workers read up to
+MAX_TOKEN - 1 bytes past the end of their range to finish the last one, and
+since no instruction can start inside another, scanning from the start of a
+range never picks up the tail of the previous shard's instruction.
+"""
+
+import mmap
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from aoc.pool import module_pool
+from memory_stream import DO_GROUP, DONT_GROUP, INSTRUCTION, MAX_TOKEN
+
+
+@dataclass
+class ShardResult:
+    """Partial sums of one shard for either starting state."""
+
+    enabled_sum: int = 0
+    disabled_sum: int = 0
+    final_enabled: bool = True  # only meaningful if saw_control
+    saw_control: bool = False
+
+
+def scan_shard(memory, start: int, end: int, use_controls=True) -> ShardResult:
+    """Sum the instructions starting in memory[start:end] for both start states."""
+    result = ShardResult()
+    prefix = 0  # muls before the first control, only counted when enabled
+    rest = 0  # muls after it, decided by the shard's own controls
+    enabled = True
+    stop = min(len(memory), end + MAX_TOKEN - 1)
+    for match in INSTRUCTION.finditer(memory, start, stop):
+        if match.start() >= end:
+            break
+        kind = match.lastindex
+        if kind == DO_GROUP or kind == DONT_GROUP:
+            if use_controls:
+                enabled = kind == DO_GROUP
+                result.saw_control = True
+        elif not result.saw_control:
+            prefix += int(match.group(1)) * int(match.group(2))
+        elif enabled:
+            rest += int(match.group(1)) * int(match.group(2))
+
+    result.enabled_sum = prefix + rest
+    result.disabled_sum = rest
+    result.final_enabled = enabled
+    return result
+
+
+def scan_file_shard(
+    filename: str, start: int, end: int, use_controls=True
+) -> ShardResult:
+    """Memory-map the file and scan one shard of it."""
+    with open(filename, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            return scan_shard(memory, start, end, use_controls)
+
+
+def combine(shards: List[ShardResult], enabled=True) -> int:
+    """Total over consecutive shards, carrying the do()/don't() state."""
+    total = 0
+    for shard in shards:
+        total += shard.enabled_sum if enabled else shard.disabled_sum
+        if shard.saw_control:
+            enabled = shard.final_enabled
+    return total
+
+
+def shard_ranges(size: int, shards: int) -> List[Tuple[int, int]]:
+    """Split [0, size) into shards contiguous, nearly equal ranges."""
+    shards = max(1, min(shards, size))
+    bounds = [size * i // shards for i in range(shards + 1)]
+    return list(zip(bounds, bounds[1:]))
+
+
+def sum_file_sharded(
+    filename: str,
+    use_controls=True,
+    workers: Optional[int] = None,
+    shards: Optional[int] = None,
+) -> int:
+    """Sum of the enabled mul instructions in a dump, scanned in parallel.
+
+    With use_controls=False do() and don't() are ignored, as in part 1.
+    """
+    try:
+        size = os.path.getsize(filename)
+    except FileNotFoundError:
+        print(f"Error: {filename} not found. Please create an input file.")
+        exit(1)
+    if not size:
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    ranges = shard_ranges(size, shards or workers)
+    if workers == 1:
+        return combine(
+            [scan_file_shard(filename, a, b, use_controls) for a, b in ranges]
+        )
+
+    with module_pool(scan_file_shard, workers) as pool:
+        results = list(
+            pool.map(
+                scan_file_shard,
+                [filename] * len(ranges),
+                [a for a, _ in ranges],
+                [b for _, b in ranges],
+                [use_controls] * len(ranges),
+            )
+        )
+    return combine(results)
@@ -1,4 +1,12 @@
+import os
 import re
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from memory_stream import sum_file  # noqa: E402
+from sharded import sum_file_sharded  # noqa: E402
 
 
 def read_input(filename="input.txt"):
@@ -34,15 +42,27 @@ def calculate_total(results):
     return sum(results)
 
 
-def main():
-    # Read input with a specific file path
-    memory = read_input("day3/input.txt")
+def solve(filename, streaming=False, parallel=False):
+    """Solve part 1 for the given input file.
+
+    With streaming=True the dump is scanned in chunks in constant memory,
+    with parallel=True it is split into shards scanned by a process pool.
+    """
+    if parallel:
+        return sum_file_sharded(filename, use_controls=False)
+    if streaming:
+        return sum_file(filename, use_controls=False)
+    memory = read_input(filename)
 
     # Find all valid multiplications and their results
     results = find_valid_multiplications(memory)
 
+    return calculate_total(results)
+
+
+def main():
     # Calculate and print only the total
-    total = calculate_total(results)
+    total = solve("day3/input.txt")
     print(total)
 
 
@@ -1,4 +1,12 @@
+import os
 import re
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from memory_stream import sum_file  # noqa: E402
+from sharded import sum_file_sharded  # noqa: E402
 
 
 def read_input(filename="input.txt"):
@@ -11,43 +19,26 @@ def read_input(filename="input.txt"):
         exit(1)
 
 
-def find_valid_multiplications(memory):
-    """Find all valid mul instructions and control instructions in the corrupted memory."""
-    # Find all mul instructions and their positions
-    mul_pattern = r"mul\((\d{1,3}),(\d{1,3})\)"
-    mul_matches = [
-        (match.start(), match.groups()) for match in re.finditer(mul_pattern, memory)
-    ]
-
-    # Find all do() and don't() instructions and their positions
-    do_pattern = r"do\(\)"
-    dont_pattern = r"don't\(\)"
-
-    do_positions = [match.start() for match in re.finditer(do_pattern, memory)]
-    dont_positions = [match.start() for match in re.finditer(dont_pattern, memory)]
-
-    # Combine control instructions with their type
-    controls = [(pos, True) for pos in do_positions] + [
-        (pos, False) for pos in dont_positions
-    ]
-    controls.sort()  # Sort by position
+# One alternation for every instruction, so the memory is scanned once and
+# instructions come out in order. Groups 1-2 are the mul operands, group 3
+# is do() and group 4 is don't().
+INSTRUCTION = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)|(do\(\))|(don't\(\))")
+DO_GROUP = 3
+DONT_GROUP = 4
 
+
+def find_valid_multiplications(memory):
+    """Yield the result of every mul instruction that is enabled when it runs."""
     # Start with multiplications enabled
     enabled = True
-    results = []
-
-    # Process each multiplication based on the most recent control instruction
-    for mul_pos, (x, y) in mul_matches:
-        # Update enabled status based on any control instructions before this multiplication
-        while controls and controls[0][0] < mul_pos:
-            _, enabled = controls.pop(0)
-
-        # If multiplications are enabled, calculate and store the result
-        if enabled:
-            result = int(x) * int(y)
-            results.append(result)
-
-    return results
+    for match in INSTRUCTION.finditer(memory):
+        kind = match.lastindex
+        if kind == DO_GROUP:
+            enabled = True
+        elif kind == DONT_GROUP:
+            enabled = False
+        elif enabled:
+            yield int(match.group(1)) * int(match.group(2))
 
 
 def calculate_total(results):
@@ -55,15 +46,27 @@ def calculate_total(results):
     return sum(results)
 
 
-def main():
-    # Read input with a specific file path
-    memory = read_input("day3/input.txt")
+def solve(filename, streaming=False, parallel=False):
+    """Solve part 2 for the given input file.
+
+    With streaming=True the dump is scanned in chunks in constant memory,
+    with parallel=True it is split into shards scanned by a process pool.
+    """
+    if parallel:
+        return sum_file_sharded(filename, use_controls=True)
+    if streaming:
+        return sum_file(filename, use_controls=True)
+    memory = read_input(filename)
 
     # Find all valid multiplications and their results
     results = find_valid_multiplications(memory)
 
+    return calculate_total(results)
+
+
+def main():
     # Calculate and print only the total
-    total = calculate_total(results)
+    total = solve("day3/input.txt")
     print(total)
 
 
@@ -0,0 +1,193 @@
+"""Persistent index of a day 4 grid for repeated word queries.
+
+For every letter the index keeps the cells holding it, and for each of the 8
+directions a table from bigram to the cells where that bigram starts. A
+query for a word then only looks at the cells where its first two letters
+already line up in a direction and checks the rest of the word there,
+instead of scanning the whole grid.
+
+The index is saved next to the input as <input>.idx together with the
+SHA-256, modification time and size of the input. It is stored as JSON, so
+loading whatever file sits there can at worst fail, never run code. While
+the modification time and size match, the saved index is used as is; when
+they change, the input is hashed again and the index rebuilt only if its
+contents changed.
+Loaded indexes are also kept in memory under the same (mtime, size) check,
+so repeated queries in one process don't touch the index file at all.
+"""
+
+import hashlib
+import json
+import os
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+VERSION = 3
+SUFFIX = ".idx"
+
+Signature = Tuple[int, int]  # input modification time in ns, size in bytes
+
+# (row step, column step) for each of the 8 directions
+DIRECTIONS = (
+    (0, 1),  # right
+    (0, -1),  # left
+    (1, 0),  # down
+    (-1, 0),  # up
+    (1, 1),  # down-right
+    (-1, -1),  # up-left
+    (1, -1),  # down-left
+    (-1, 1),  # up-right
+)
+
+
+def index_path(filename: str) -> str:
+    """Where the index of an input file is stored."""
+    return filename + SUFFIX
+
+
+def input_digest(filename: str) -> str:
+    """SHA-256 of the input file."""
+    with open(filename, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def input_signature(filename: str) -> Signature:
+    """(modification time, size) of the input file."""
+    stat = os.stat(filename)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class GridIndex:
+    """Letter positions and directional bigram starts of one grid."""
+
+    def __init__(
+        self, grid: List[str], digest: str = "", signature: Signature = (0, 0)
+    ):
+        self.grid = grid
+        self.digest = digest
+        self.signature = signature
+        self.height = len(grid)
+        self.width = len(grid[0]) if grid else 0
+        self.letters: Dict[str, array] = {}
+        self.bigrams: List[Dict[str, array]] = [{} for _ in DIRECTIONS]
+
+        for row, line in enumerate(grid):
+            for col, char in enumerate(line):
+                cell = row * self.width + col
+                self.letters.setdefault(char, array("i")).append(cell)
+                for table, (dr, dc) in zip(self.bigrams, DIRECTIONS):
+                    next_row, next_col = row + dr, col + dc
+                    if 0 <= next_row < self.height and 0 <= next_col < self.width:
+                        bigram = char + grid[next_row][next_col]
+                        table.setdefault(bigram, array("i")).append(cell)
+
+    def count(self, word: str) -> int:
+        """Occurrences of word in all 8 directions."""
+        if not word:
+            return 0
+        if len(word) == 1:
+            # A single letter reads the same in every direction
+            return len(self.letters.get(word, ())) * len(DIRECTIONS)
+
+        grid, width, height = self.grid, self.width, self.height
+        last = len(word) - 1
+        count = 0
+        for table, (dr, dc) in zip(self.bigrams, DIRECTIONS):
+            for cell in table.get(word[:2], ()):
+                row, col = divmod(cell, width)
+                end_row, end_col = row + last * dr, col + last * dc
+                if not (0 <= end_row < height and 0 <= end_col < width):
+                    continue
+                if all(
+                    grid[row + i * dr][col + i * dc] == word[i]
+                    for i in range(2, len(word))
+                ):
+                    count += 1
+        return count
+
+    def count_many(self, words) -> Dict[str, int]:
+        """Occurrences of each word in all 8 directions."""
+        return {word: self.count(word) for word in words}
+
+    def save(self, path: str):
+        """Write the index to path as JSON."""
+        state = {
+            "version": VERSION,
+            "digest": self.digest,
+            "signature": list(self.signature),
+            "grid": self.grid,
+            "letters": {char: cells.tolist() for char, cells in self.letters.items()},
+            "bigrams": [
+                {bigram: cells.tolist() for bigram, cells in table.items()}
+                for table in self.bigrams
+            ],
+        }
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["GridIndex"]:
+        """The index saved at path, or None if it is missing or unreadable."""
+        try:
+            with open(path, "r") as f:
+                state = json.load(f)
+            if state["version"] != VERSION:
+                return None
+            grid = state["grid"]
+            if not all(isinstance(line, str) for line in grid):
+                return None
+            letters = {
+                char: array("i", cells) for char, cells in state["letters"].items()
+            }
+            bigrams = [
+                {bigram: array("i", cells) for bigram, cells in table.items()}
+                for table in state["bigrams"]
+            ]
+            digest, (mtime_ns, size) = state["digest"], state["signature"]
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return None
+        if len(bigrams) != len(DIRECTIONS):
+            return None
+
+        index = cls.__new__(cls)
+        index.grid, index.digest, index.signature = grid, digest, (mtime_ns, size)
+        index.height = len(grid)
+        index.width = len(grid[0]) if grid else 0
+        index.letters, index.bigrams = letters, bigrams
+        return index
+
+    @classmethod
+    def for_file(cls, filename: str) -> "GridIndex":
+        """The index of an input file, built and saved if missing or stale.
+
+        Raises FileNotFoundError if the input does not exist.
+        """
+        key = os.path.abspath(filename)
+        signature = input_signature(filename)
+        cached = _loaded.get(key)
+        if cached is not None and cached.signature == signature:
+            return cached
+
+        path = index_path(filename)
+        index = cls.load(path)
+        if index is None or index.signature != signature:
+            # Touched or new: only a changed digest means a changed grid
+            digest = input_digest(filename)
+            if index is None or index.digest != digest:
+                with open(filename, "r") as file:
+                    lines = [line.strip() for line in file if line.strip()]
+                index = cls(lines, digest)
+            index.signature = signature
+            try:
+                index.save(path)
+            except OSError:  # read-only input directory, keep it in memory
+                pass
+
+        _loaded[key] = index
+        return index
+
+
+# Indexes loaded by this process, by absolute input path
+_loaded: Dict[str, GridIndex] = {}
@@ -1,3 +1,7 @@
+from grid_index import GridIndex
+from word_search import WordSearch
+
+
 def read_input(filename="input.txt"):
     """Read the input file and return the word search grid."""
     try:
@@ -8,61 +12,25 @@ def read_input(filename="input.txt"):
         exit(1)
 
 
-def find_word_in_direction(grid, row, col, dx, dy, word):
-    """Check if word exists starting at (row,col) in direction (dx,dy)."""
-    height = len(grid)
-    width = len(grid[0])
-    word_len = len(word)
-
-    # Check if the word would fit in this direction
-    end_row = row + (word_len - 1) * dy
-    end_col = col + (word_len - 1) * dx
-
-    if not (0 <= end_row < height and 0 <= end_col < width):
-        return False
-
-    # Check each character of the word
-    for i in range(word_len):
-        if grid[row + i * dy][col + i * dx] != word[i]:
-            return False
-
-    return True
-
-
 def count_word_occurrences(grid, word):
     """Count all occurrences of word in the grid in all directions."""
-    height = len(grid)
-    width = len(grid[0])
-    count = 0
+    return WordSearch(grid).count(word)
 
-    # All possible directions
-    directions = [
-        (0, 1),  # right
-        (0, -1),  # left
-        (1, 0),  # down
-        (-1, 0),  # up
-        (1, 1),  # down-right
-        (-1, -1),  # up-left
-        (1, -1),  # down-left
-        (-1, 1),  # up-right
-    ]
 
-    # Try each starting position and direction
-    for row in range(height):
-        for col in range(width):
-            for dx, dy in directions:
-                if find_word_in_direction(grid, row, col, dx, dy, word):
-                    count += 1
+def solve(filename, indexed=False):
+    """Solve part 1 for the given input file.
 
-    return count
+    With indexed=True the query goes through the grid's saved index, which
+    is built on first use and reused until the input changes.
+    """
+    if indexed:
+        return GridIndex.for_file(filename).count("XMAS")
+    return count_word_occurrences(read_input(filename), "XMAS")
 
 
 def main():
-    # Read input with a specific file path
-    grid = read_input("day4/input.txt")
-
     # Count occurrences of XMAS
-    count = count_word_occurrences(grid, "XMAS")
+    count = solve("day4/input.txt")
 
     # Print only the count
     print(count)
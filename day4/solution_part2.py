@@ -1,3 +1,12 @@
+import os
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stencil import NUMPY_AVAILABLE, count_xmas, grid_array  # noqa: E402
+
+
 def read_input(filename="input.txt"):
     """Read the input file and return the word search grid."""
     try:
@@ -87,12 +96,16 @@ def count_xmas_patterns(grid):
     return count
 
 
-def main():
-    # Read input with a specific file path
-    grid = read_input("day4/input.txt")
+def solve(filename):
+    """Solve part 2 for the given input file."""
+    if NUMPY_AVAILABLE:
+        return count_xmas(grid_array(read_input(filename)))
+    return count_xmas_patterns(read_input(filename))
 
+
+def main():
     # Count X-MAS patterns
-    count = count_xmas_patterns(grid)
+    count = solve("day4/input.txt")
 
     # Print only the count
     print(count)
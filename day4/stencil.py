@@ -0,0 +1,76 @@
+"""Vectorized 2D stencil matching for day 4, with the X-MAS as one stencil.
+
+A stencil is a small template of rows where "." matches anything, e.g.
+
+    M.S
+    .A.
+    M.S
+
+The grid is a uint8 array and a template is matched at every position at
+once: for each of its fixed cells, the grid is shifted by that cell's offset
+and compared against the letter, and the boolean masks are and-ed together.
+"""
+
+from typing import Iterable, List, Tuple
+
+from aoc.arrays import NUMPY_AVAILABLE, np  # noqa: F401
+
+WILDCARD = "."
+
+X_MAS = ("M.S", ".A.", "M.S")
+
+
+def grid_array(grid: List[str]):
+    """The grid as a 2D uint8 array of character codes."""
+    height = len(grid)
+    width = len(grid[0]) if height else 0
+    return np.frombuffer("".join(grid).encode(), dtype=np.uint8).reshape(height, width)
+
+
+def rotations(template: Tuple[str, ...]) -> List[Tuple[str, ...]]:
+    """The distinct quarter turns of a template."""
+    found = []
+    for _ in range(4):
+        if template not in found:
+            found.append(template)
+        # Rotate clockwise: the first column read bottom up becomes the first row
+        template = tuple("".join(column) for column in zip(*reversed(template)))
+    return found
+
+
+def template_cells(template: Tuple[str, ...]) -> List[Tuple[int, int, int]]:
+    """(row, col, character code) of every non-wildcard cell of a template."""
+    return [
+        (row, col, ord(char))
+        for row, line in enumerate(template)
+        for col, char in enumerate(line)
+        if char != WILDCARD
+    ]
+
+
+def match_mask(array, template: Tuple[str, ...]):
+    """Boolean mask of the top-left positions where template matches."""
+    height, width = array.shape
+    rows = height - len(template) + 1
+    cols = width - max(map(len, template), default=0) + 1
+    if rows <= 0 or cols <= 0:
+        return np.zeros((max(rows, 0), max(cols, 0)), dtype=bool)
+
+    mask = np.ones((rows, cols), dtype=bool)
+    for row, col, code in template_cells(template):
+        mask &= array[row : row + rows, col : col + cols] == code
+    return mask
+
+
+def count_stencil(array, templates: Iterable[Tuple[str, ...]]) -> int:
+    """Top-left positions where at least one of the templates matches."""
+    matched = np.zeros(array.shape, dtype=bool)
+    for template in templates:
+        mask = match_mask(array, template)
+        matched[: mask.shape[0], : mask.shape[1]] |= mask
+    return int(matched.sum())
+
+
+def count_xmas(array) -> int:
+    """Count all X-MAS patterns: MAS twice in an X, in any orientation."""
+    return count_stencil(array, rotations(X_MAS))
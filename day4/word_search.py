@@ -0,0 +1,112 @@
+"""Multi-word search over every line of a day 4 grid with Aho-Corasick.
+
+A word can run in 8 directions, but each of them is either forwards or
+backwards along one of four line families: rows, columns, down-right
+diagonals and down-left diagonals. The grid is cut into those lines once
+and joined into a single text, with a separator between lines so no match
+spans two of them. An Aho-Corasick automaton over the words and their
+reverses then counts every occurrence in one pass over that text, in time
+linear in the grid size whatever the number of words.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List
+
+SEPARATOR = "\n"
+
+
+def grid_lines(grid: List[str]) -> List[str]:
+    """Rows, columns, down-right and down-left diagonals of the grid."""
+    height = len(grid)
+    width = len(grid[0]) if height else 0
+
+    lines = list(grid)
+    lines.extend("".join(row[col] for row in grid) for col in range(width))
+    # Cells on one down-right diagonal share col - row
+    for offset in range(-(height - 1), width):
+        lines.append(
+            "".join(
+                grid[row][row + offset]
+                for row in range(max(0, -offset), min(height, width - offset))
+            )
+        )
+    # Cells on one down-left diagonal share col + row
+    for total in range(height + width - 1):
+        lines.append(
+            "".join(
+                grid[row][total - row]
+                for row in range(max(0, total - width + 1), min(height, total + 1))
+            )
+        )
+    return lines
+
+
+class AhoCorasick:
+    """Automaton counting the occurrences of several patterns in one pass."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = list(dict.fromkeys(p for p in patterns if p))
+        # Trie as one dict of transitions per state, state 0 is the root
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.output[state].append(index)
+
+        # Breadth first, so a state's failure link is ready before its children
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Number of occurrences of each pattern in text, overlaps included."""
+        goto, fail, output = self.goto, self.fail, self.output
+        counts = [0] * len(self.patterns)
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                counts[index] += 1
+        return dict(zip(self.patterns, counts))
+
+
+class WordSearch:
+    """A grid preprocessed into its lines, ready for any number of word queries."""
+
+    def __init__(self, grid: List[str]):
+        self.text = SEPARATOR.join(grid_lines(grid))
+
+    def count_many(self, words: Iterable[str]) -> Dict[str, int]:
+        """Occurrences of each word in all 8 directions, in one pass."""
+        words = list(words)
+        found = AhoCorasick(
+            pattern for word in words for pattern in (word, word[::-1])
+        ).count(self.text)
+        # Forwards and backwards along a line are two different directions,
+        # so a palindrome is rightly counted twice
+        return {
+            word: found.get(word, 0) + found.get(word[::-1], 0) if word else 0
+            for word in words
+        }
+
+    def count(self, word: str) -> int:
+        """Occurrences of word in all 8 directions."""
+        return self.count_many([word])[word]
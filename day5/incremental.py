@@ -0,0 +1,98 @@
+"""Incremental day 5 answers under changing ordering rules.
+
+A rule between pages a and b can only change the result of updates that
+contain both pages, so the engine keeps an inverted index from page to the
+updates containing it and, on every rule insertion or deletion, re-checks
+just the intersection of the two pages' updates. The part 1 and part 2 sums
+are kept current by swapping out the affected updates' old contributions.
+Updates are checked and sorted with the same functions as the solutions.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+from solution_part1 import get_middle_page, is_valid_order
+from solution_part2 import topological_sort
+
+
+class IncrementalOrdering:
+    """Part 1 and part 2 sums over fixed updates, with rules added and removed."""
+
+    def __init__(self, rules: List[Tuple[int, int]], updates: List[List[int]]):
+        self.updates = updates
+        self.rule_index: Set[Tuple[int, int]] = set(rules)
+        self.must_come_before: Dict[int, Set[int]] = defaultdict(set)
+        self.must_come_after: Dict[int, Set[int]] = defaultdict(set)
+        for before, after in rules:
+            self.must_come_before[before].add(after)
+            self.must_come_after[after].add(before)
+
+        self.updates_with_page: Dict[int, Set[int]] = defaultdict(set)
+        for i, update in enumerate(updates):
+            for page in update:
+                self.updates_with_page[page].add(i)
+
+        # Per update: (in order, middle page of the update once sorted)
+        self.results = [self.evaluate(update) for update in updates]
+        self.part1_total = sum(middle for valid, middle in self.results if valid)
+        self.part2_total = sum(middle for valid, middle in self.results if not valid)
+
+    def evaluate(self, pages) -> Tuple[bool, int]:
+        """(in order, middle page once sorted) for one update."""
+        if is_valid_order(pages, self.rule_index):
+            return True, get_middle_page(pages)
+        ordered = topological_sort(pages, self.must_come_before, self.must_come_after)
+        return False, get_middle_page(ordered)
+
+    def affected(self, a: int, b: int) -> Set[int]:
+        """Indices of the updates containing both pages."""
+        return self.updates_with_page.get(a, set()) & self.updates_with_page.get(
+            b, set()
+        )
+
+    def refresh(self, indices):
+        """Re-check the given updates and adjust the running sums.
+
+        Everything is evaluated before anything is changed, so a ValueError
+        from a cyclic update leaves the sums untouched.
+        """
+        fresh = {i: self.evaluate(self.updates[i]) for i in indices}
+        for i, (valid, middle) in fresh.items():
+            old_valid, old_middle = self.results[i]
+            if old_valid:
+                self.part1_total -= old_middle
+            else:
+                self.part2_total -= old_middle
+            if valid:
+                self.part1_total += middle
+            else:
+                self.part2_total += middle
+            self.results[i] = valid, middle
+
+    def add_rule(self, before: int, after: int):
+        """Require before to come ahead of after.
+
+        Raises ValueError, without adding the rule, if it would make an
+        update's rules cyclic.
+        """
+        if (before, after) in self.rule_index:
+            return
+        self.rule_index.add((before, after))
+        self.must_come_before[before].add(after)
+        self.must_come_after[after].add(before)
+        try:
+            self.refresh(self.affected(before, after))
+        except ValueError:
+            self.rule_index.discard((before, after))
+            self.must_come_before[before].discard(after)
+            self.must_come_after[after].discard(before)
+            raise
+
+    def remove_rule(self, before: int, after: int):
+        """Drop the rule putting before ahead of after, if there is one."""
+        if (before, after) not in self.rule_index:
+            return
+        self.rule_index.discard((before, after))
+        self.must_come_before[before].discard(after)
+        self.must_come_after[after].discard(before)
+        self.refresh(self.affected(before, after))
@@ -0,0 +1,122 @@
+"""Day 5 rules compiled into a packed bit matrix for checking updates in bulk.
+
+Page numbers are remapped to consecutive IDs and rule (before, after) sets
+bit [before, after] of a packed bit matrix, so a whole batch of page pairs
+is looked up with a few array operations. Updates are packed into one
+ragged array (flat page IDs plus offsets, see aoc.arrays).
+
+Every page is paired with every page of its update. An update is invalid
+when a rule puts a later page ahead of an earlier one, and a page's rank is
+how many pages of its update are ruled to come before it. When the ranks of
+an update are exactly 0 .. len - 1 its rules order every pair, and the page
+of rank len // 2 is the middle of the sorted update. Updates whose rules
+leave pairs unordered are handed to a fallback that sorts them.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from aoc.arrays import NUMPY_AVAILABLE, np, pack_rows  # noqa: F401
+
+
+class RuleMatrix:
+    """Ordering rules as a packed bit matrix over remapped page IDs."""
+
+    def __init__(self, rules: List[Tuple[int, int]]):
+        pages = sorted({page for rule in rules for page in rule})
+        self.ids: Dict[int, int] = {page: i for i, page in enumerate(pages)}
+        # One extra ID for pages that appear in no rule
+        self.unknown = len(pages)
+        size = len(pages) + 1
+
+        # Bit after of row before, most significant bit first like np.packbits
+        self.bits = np.zeros((size, (size + 7) // 8), dtype=np.uint8)
+        if rules:
+            pairs = np.array([(self.ids[a], self.ids[b]) for a, b in rules])
+            before, after = pairs[:, 0], pairs[:, 1]
+            masks = (0x80 >> (after & 7)).astype(np.uint8)
+            np.bitwise_or.at(self.bits, (before, after >> 3), masks)
+
+    def remap(self, pages):
+        """Page numbers to IDs."""
+        ids, unknown = self.ids, self.unknown
+        return np.fromiter(
+            (ids.get(page, unknown) for page in pages), dtype=np.int64, count=len(pages)
+        )
+
+    def ordered(self, before, after):
+        """Elementwise: is there a rule putting page ID before ahead of after?"""
+        byte = self.bits[before, after >> 3]
+        return ((byte >> (7 - (after & 7))) & 1).astype(bool)
+
+
+def check_updates(matrix: RuleMatrix, ids, offsets):
+    """(valid, rank): which updates are in order, and every page's rank."""
+    lengths = np.diff(offsets)
+    update = np.repeat(np.arange(len(lengths)), lengths)
+
+    # Pair every page with every page of its own update
+    repeats = lengths[update]
+    first = np.repeat(np.arange(len(ids)), repeats)
+    pair_start = np.repeat(np.cumsum(repeats) - repeats, repeats)
+    second = offsets[update[first]] + np.arange(len(first)) - pair_start
+
+    # second is ruled to come before first: a violation if it comes later
+    before = matrix.ordered(ids[second], ids[first])
+    violated = before & (second > first)
+    bad_per_update = np.bincount(update[first[violated]], minlength=len(lengths))
+    rank = np.bincount(first[before], minlength=len(ids))
+    return bad_per_update == 0, rank
+
+
+def fully_ranked(rank, offsets):
+    """Which updates have ranks exactly 0 .. len - 1, one page each."""
+    lengths = np.diff(offsets)
+    update = np.repeat(np.arange(len(lengths)), lengths)
+    # Count the pages landing on each rank slot of their update
+    fits = rank < lengths[update]
+    slots = np.bincount((offsets[update] + rank)[fits], minlength=len(rank))
+    filled = np.bincount(update, weights=slots == 1, minlength=len(lengths))
+    return filled == lengths
+
+
+def _batch(rules, updates):
+    matrix = RuleMatrix(rules)
+    pages, offsets = pack_rows(updates)
+    valid, rank = check_updates(matrix, matrix.remap(pages), offsets)
+    return pages, offsets, valid, rank
+
+
+def valid_middle_sum(rules, updates) -> int:
+    """Sum of the middle pages of the updates that are in order."""
+    pages, offsets, valid, _ = _batch(rules, updates)
+    middle = pages[offsets[:-1] + np.diff(offsets) // 2]
+    return int(middle[valid].sum())
+
+
+def middle_sums(
+    rules, updates, fallback: Optional[Callable[[List[int]], int]] = None
+) -> Tuple[int, int]:
+    """(valid, invalid) sums of sorted middle pages, from one batch pass.
+
+    fallback(pages) gives the sorted middle page of an invalid update whose
+    rules leave some of its pages unordered; without one such an update
+    raises ValueError.
+    """
+    pages, offsets, valid, rank = _batch(rules, updates)
+    lengths = np.diff(offsets)
+    update = np.repeat(np.arange(len(lengths)), lengths)
+
+    middle = pages[offsets[:-1] + lengths // 2]
+    ranked = fully_ranked(rank, offsets)
+    is_middle = ranked[update] & (rank == lengths[update] // 2)
+    middle[update[is_middle]] = pages[is_middle]
+
+    invalid_total = int(middle[~valid & ranked].sum())
+    unranked = np.flatnonzero(~valid & ~ranked)
+    if len(unranked) and fallback is None:
+        raise ValueError(
+            f"{len(unranked)} invalid updates are only partially ordered by "
+            "the rules and need a fallback sort"
+        )
+    invalid_total += sum(fallback(updates[i]) for i in unranked)
+    return int(middle[valid].sum()), invalid_total
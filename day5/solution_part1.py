@@ -1,4 +1,10 @@
-from collections import defaultdict
+import os
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rule_matrix import NUMPY_AVAILABLE, valid_middle_sum  # noqa: E402
 
 
 def read_input(filename="input.txt"):
@@ -28,43 +34,22 @@ def read_input(filename="input.txt"):
     return rules, updates
 
 
-def build_dependencies(rules):
-    """Build a graph of dependencies where key must come before all values in its set."""
-    must_come_before = defaultdict(set)
-    must_come_after = defaultdict(set)
-
-    for before, after in rules:
-        must_come_before[before].add(after)
-        must_come_after[after].add(before)
-
-    return must_come_before, must_come_after
-
-
-def is_valid_order(pages, must_come_before, must_come_after):
-    """Check if the pages are in valid order according to the rules."""
-    # For each page, check if it violates any rules with pages that come after it
-    for i, page in enumerate(pages):
-        # Get all pages that should come after this one
-        must_follow = must_come_before[page]
-        # Get all pages that should come before this one
-        must_precede = must_come_after[page]
+def build_rule_index(rules):
+    """Index the rules as a set of (before, after) pairs."""
+    return set(rules)
 
-        # Check pages that come after this one in the sequence
-        following_pages = set(pages[i + 1 :])
 
-        # If any page that must come after is not in the following pages
-        # and is in the current update, the order is invalid
-        for required_follower in must_follow:
-            if required_follower in pages and required_follower not in following_pages:
-                return False
+def is_valid_order(pages, rule_index):
+    """Check if the pages are in valid order according to the rules.
 
-        # If any page that must come before is in the following pages,
-        # the order is invalid
-        for required_predecessor in must_precede:
-            if required_predecessor in following_pages:
-                return False
-
-    return True
+    The update is out of order if some rule puts a later page ahead of an
+    earlier one. Pages no rule relates may appear in any order.
+    """
+    return not any(
+        (later, earlier) in rule_index
+        for i, earlier in enumerate(pages)
+        for later in pages[i + 1 :]
+    )
 
 
 def get_middle_page(pages):
@@ -72,22 +57,31 @@ def get_middle_page(pages):
     return pages[len(pages) // 2]
 
 
-def main():
-    # Read input
-    rules, updates = read_input("day5/input.txt")
+def solve(filename, batch=False):
+    """Solve part 1 for the given input file.
+
+    With batch=True all updates are checked at once against a bit matrix of
+    the rules, when numpy is available.
+    """
+    rules, updates = read_input(filename)
+    if batch and NUMPY_AVAILABLE:
+        return valid_middle_sum(rules, updates)
 
-    # Build dependency graphs
-    must_come_before, must_come_after = build_dependencies(rules)
+    rule_index = build_rule_index(rules)
 
     # Process each update
     total = 0
     for update in updates:
-        if is_valid_order(update, must_come_before, must_come_after):
+        if is_valid_order(update, rule_index):
             middle = get_middle_page(update)
             total += middle
 
+    return total
+
+
+def main():
     # Print only the final sum
-    print(total)
+    print(solve("day5/input.txt"))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,14 @@
+import heapq
+import os
+import sys
 from collections import defaultdict
 
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rule_matrix import NUMPY_AVAILABLE, middle_sums  # noqa: E402
+from solution_part1 import build_rule_index, is_valid_order  # noqa: E402
+
 
 def read_input(filename="input.txt"):
     """Read and parse the input file into rules and updates."""
@@ -40,53 +49,60 @@ def build_dependencies(rules):
     return must_come_before, must_come_after
 
 
-def is_valid_order(pages, must_come_before, must_come_after):
-    """Check if the pages are in valid order according to the rules."""
-    for i, page in enumerate(pages):
-        following_pages = set(pages[i + 1 :])
-
-        # Check if any required followers are missing from the following pages
-        for required_follower in must_come_before[page]:
-            if required_follower in pages and required_follower not in following_pages:
-                return False
+def topological_sort(pages, must_come_before, must_come_after):
+    """Sort pages according to the dependency rules with Kahn's algorithm.
+
+    Only the rules between pages of this update are used. Of the pages ready
+    to go next, the one earliest in the update goes first, so pages no rule
+    orders keep their relative order. Raises ValueError if the rules contain
+    a cycle, since then no order satisfies them.
+    """
+    position = {page: i for i, page in enumerate(pages)}
+
+    # Count how many of the update's pages must come before each page
+    in_degree = {
+        page: sum(1 for other in must_come_after[page] if other in position)
+        for page in pages
+    }
+
+    # Repeatedly emit a page whose predecessors have all been emitted
+    ready = [i for i, page in enumerate(pages) if in_degree[page] == 0]
+    result = []
+    while ready:
+        page = pages[heapq.heappop(ready)]
+        result.append(page)
+        for follower in must_come_before[page]:
+            if follower in position:
+                in_degree[follower] -= 1
+                if in_degree[follower] == 0:
+                    heapq.heappush(ready, position[follower])
 
-        # Check if any required predecessors appear after this page
-        for required_predecessor in must_come_after[page]:
-            if required_predecessor in following_pages:
-                return False
+    if len(result) < len(position):
+        stuck = sorted(page for page in position if in_degree[page] > 0)
+        raise ValueError(
+            f"Ordering rules for update {pages} form a cycle among {stuck}"
+        )
 
-    return True
+    return result
 
 
-def topological_sort(pages, must_come_before, must_come_after):
-    """Sort pages according to the dependency rules."""
-    # Create a copy of the dependencies for the pages we have
-    local_before = defaultdict(set)
-    local_after = defaultdict(set)
+def select_middle_page(pages, must_come_before, must_come_after):
+    """Get the middle page of the sorted update without sorting it.
 
-    # Only include rules relevant to our pages
+    A page's rank is the number of the update's pages that must come before
+    it. When the ranks are exactly 0 .. len - 1 the rules order every pair
+    and the sorted position of each page is its rank; otherwise this falls
+    back to a full sort.
+    """
     page_set = set(pages)
-    for page in pages:
-        for follower in must_come_before[page]:
-            if follower in page_set:
-                local_before[page].add(follower)
-        for predecessor in must_come_after[page]:
-            if predecessor in page_set:
-                local_after[page].add(predecessor)
-
-    # Sort pages based on dependencies
-    result = []
-    remaining = set(pages)
-
-    while remaining:
-        # Find a page with no remaining predecessors
-        for page in remaining:
-            if not any(page in local_after[other] for other in remaining):
-                result.append(page)
-                remaining.remove(page)
-                break
-
-    return result
+    ranks = {
+        page: sum(1 for other in must_come_after[page] if other in page_set)
+        for page in pages
+    }
+    if sorted(ranks.values()) == list(range(len(pages))):
+        middle = len(pages) // 2
+        return next(page for page, rank in ranks.items() if rank == middle)
+    return get_middle_page(topological_sort(pages, must_come_before, must_come_after))
 
 
 def get_middle_page(pages):
@@ -94,24 +110,48 @@ def get_middle_page(pages):
     return pages[len(pages) // 2]
 
 
-def main():
-    # Read input
-    rules, updates = read_input("day5/input.txt")
+def solve(filename, middle_only=False, batch=False):
+    """Solve part 2 for the given input file.
 
+    With middle_only=True the middle page of each invalid update is selected
+    directly instead of sorting the update first. With batch=True all
+    updates are handled at once against a bit matrix of the rules, when
+    numpy is available.
+    """
+    rules, updates = read_input(filename)
     # Build dependency graphs
     must_come_before, must_come_after = build_dependencies(rules)
 
+    if batch and NUMPY_AVAILABLE:
+
+        def sorted_middle(pages):
+            return get_middle_page(
+                topological_sort(pages, must_come_before, must_come_after)
+            )
+
+        return middle_sums(rules, updates, sorted_middle)[1]
+    rule_index = build_rule_index(rules)
+
     # Process each update
     total = 0
     for update in updates:
-        if not is_valid_order(update, must_come_before, must_come_after):
-            # Sort the invalid update
-            sorted_update = topological_sort(update, must_come_before, must_come_after)
-            middle = get_middle_page(sorted_update)
+        if not is_valid_order(update, rule_index):
+            if middle_only:
+                middle = select_middle_page(update, must_come_before, must_come_after)
+            else:
+                # Sort the invalid update
+                sorted_update = topological_sort(
+                    update, must_come_before, must_come_after
+                )
+                middle = get_middle_page(sorted_update)
             total += middle
 
+    return total
+
+
+def main():
     # Print only the final sum
-    print(total)
+    print(solve("day5/input.txt"))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+import os
+import random
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from incremental import IncrementalOrdering  # noqa: E402
+from rule_matrix import NUMPY_AVAILABLE, middle_sums, valid_middle_sum  # noqa: E402
+from solution_part1 import (  # noqa: E402
+    build_rule_index,
+    get_middle_page,
+    is_valid_order,
+)
+from solution_part2 import (  # noqa: E402
+    build_dependencies,
+    select_middle_page,
+    topological_sort,
+)
+
+
+def random_case(rng, pages=40, density=0.3, updates=200):
+    """Acyclic rules over a random page order, keeping each rule with the given
+    probability, and updates of random pages in random order."""
+    order = rng.sample(range(10, 100), pages)
+    rules = [
+        (a, b)
+        for i, a in enumerate(order)
+        for b in order[i + 1 :]
+        if rng.random() < density
+    ]
+    picked = [rng.sample(order, rng.choice([3, 5, 7, 9, 11])) for _ in range(updates)]
+    return rules, picked
+
+
+def loop_sums(rules, updates, middle_only=False):
+    """(part 1, part 2) with the loop versions of the solutions."""
+    rule_index = build_rule_index(rules)
+    must_come_before, must_come_after = build_dependencies(rules)
+    valid_total = invalid_total = 0
+    for update in updates:
+        if is_valid_order(update, rule_index):
+            valid_total += get_middle_page(update)
+        elif middle_only:
+            invalid_total += select_middle_page(
+                update, must_come_before, must_come_after
+            )
+        else:
+            ordered = topological_sort(update, must_come_before, must_come_after)
+            invalid_total += get_middle_page(ordered)
+    return valid_total, invalid_total
+
+
+def all_sums(rules, updates):
+    """(part 1, part 2) from every day 5 path, by name."""
+    sums = {
+        "loop": loop_sums(rules, updates),
+        "middle_only": loop_sums(rules, updates, middle_only=True),
+    }
+    engine = IncrementalOrdering(rules, updates)
+    sums["incremental"] = (engine.part1_total, engine.part2_total)
+
+    if NUMPY_AVAILABLE:
+        must_come_before, must_come_after = build_dependencies(rules)
+
+        def sorted_middle(pages):
+            return get_middle_page(
+                topological_sort(pages, must_come_before, must_come_after)
+            )
+
+        _, invalid_total = middle_sums(rules, updates, sorted_middle)
+        sums["batch"] = (valid_middle_sum(rules, updates), invalid_total)
+    return sums
+
+
+def verify_incremental(rng, rules, updates, steps=20):
+    """Remove and re-add random rules, comparing against a fresh engine."""
+    engine = IncrementalOrdering(rules, updates)
+    current = list(rules)
+    for _ in range(steps):
+        before, after = rule = rng.choice(rules)
+        if rule in current:
+            engine.remove_rule(before, after)
+            current.remove(rule)
+        else:
+            engine.add_rule(before, after)
+            current.append(rule)
+        fresh = loop_sums(current, updates)
+        if (engine.part1_total, engine.part2_total) != fresh:
+            return False
+    return True
+
+
+def verify_paths(cases=20, seed=2024):
+    """Check that all paths agree on random partial rule sets."""
+    rng = random.Random(seed)
+    failed = set()
+    for case in range(cases):
+        density = rng.choice([0.05, 0.2, 0.5, 0.9, 1.0])
+        rules, updates = random_case(rng, density=density)
+        sums = all_sums(rules, updates)
+        if len(set(sums.values())) != 1:
+            failed.add(case)
+            print(f"Case {case} (density {density}): {sums}")
+        if not verify_incremental(rng, rules, updates):
+            failed.add(case)
+            print(f"Case {case} (density {density}): incremental updates drift")
+
+    print(f"{cases - len(failed)}/{cases} cases agree across {', '.join(sums)}")
+    return not failed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_paths() else 1)
@@ -0,0 +1,113 @@
+"""Day 6 search for the obstacle positions that trap the guard in a loop.
+
+An obstacle only changes the walk if the guard would have walked into it,
+so the candidates are the cells of the unobstructed path. Everything the
+guard does before first reaching a candidate is unaffected by it, so each
+trial starts from the state just before that point instead of from the
+start. Trials jump from turn to turn and remember the (cell, direction) of
+each turn in a bitmap with one byte per cell and one bit per direction; a
+repeated turn means a loop. The trials are independent, so they are spread
+over a process pool in chunks.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+from aoc.pool import module_pool
+from solution_part1 import STEPS, ObstacleIndex, find_guard_start, turn_right
+
+# Candidates per pool task
+CHUNK_SIZE = 256
+
+State = Tuple[int, int, int]  # x, y, direction
+
+# Obstacle index of the grid being searched, set up once per worker
+_worker_obstacles: Optional[ObstacleIndex] = None
+
+
+def path_candidates(grid, obstacles: ObstacleIndex) -> Dict[Tuple[int, int], State]:
+    """Each open cell of the unobstructed path, with the state just before it.
+
+    The state is where the guard stands and which way it faces right before
+    first stepping onto the cell. If the unobstructed walk never leaves the
+    map, every open cell is a candidate, tried from the start.
+    """
+    start = find_guard_start(grid)
+    if not start:
+        return {}
+
+    x, y, direction = start
+    candidates = {}
+    seen = {(x, y)}
+    turns = set()
+    while True:
+        stop_x, stop_y, leaves = obstacles.next_stop(x, y, direction)
+        dx, dy = STEPS[direction]
+        for _ in range(abs(stop_x - x) + abs(stop_y - y)):
+            cell = (x + dx, y + dy)
+            if cell not in seen:
+                seen.add(cell)
+                if grid[cell[1]][cell[0]] == ".":
+                    candidates[cell] = (x, y, direction)
+            x, y = cell
+        if leaves:
+            return candidates
+        if (x, y, direction) in turns:
+            # The guard loops even without a new obstacle, so any open cell
+            # keeps it looping unless the obstacle breaks the loop: try all
+            return {
+                (col, row): start
+                for row, line in enumerate(grid)
+                for col, cell in enumerate(line)
+                if cell == "."
+            }
+        turns.add((x, y, direction))
+        direction = turn_right(direction)
+
+
+def creates_loop(obstacles: ObstacleIndex, state: State, obstacle) -> bool:
+    """True if the guard, starting from state, loops with the extra obstacle."""
+    x, y, direction = state
+    width = obstacles.width
+    turns = bytearray(width * obstacles.height)
+
+    while True:
+        x, y, leaves = obstacles.next_stop(x, y, direction, obstacle)
+        if leaves:
+            return False
+
+        cell = y * width + x
+        bit = 1 << direction
+        if turns[cell] & bit:
+            return True
+        turns[cell] |= bit
+        direction = turn_right(direction)
+
+
+def check_candidates(chunk, obstacles: Optional[ObstacleIndex] = None):
+    """The cells of chunk, given as (cell, state) pairs, that create a loop."""
+    obstacles = obstacles or _worker_obstacles
+    return [cell for cell, state in chunk if creates_loop(obstacles, state, cell)]
+
+
+def _init_worker(grid):
+    global _worker_obstacles
+    _worker_obstacles = ObstacleIndex(grid)
+
+
+def find_loop_positions(grid, workers: Optional[int] = None):
+    """Find all positions where placing an obstacle creates a loop."""
+    obstacles = ObstacleIndex(grid)
+    candidates = list(path_candidates(grid, obstacles).items())
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(candidates) <= CHUNK_SIZE:
+        return set(check_candidates(candidates, obstacles))
+
+    chunks = [
+        candidates[i : i + CHUNK_SIZE] for i in range(0, len(candidates), CHUNK_SIZE)
+    ]
+    loop_positions: List[Tuple[int, int]] = []
+    with module_pool(check_candidates, workers, _init_worker, (grid,)) as pool:
+        for found in pool.map(check_candidates, chunks):
+            loop_positions.extend(found)
+    return set(loop_positions)
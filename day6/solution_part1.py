@@ -1,3 +1,6 @@
+from bisect import bisect_left, bisect_right
+
+
 def read_input(filename="input.txt"):
     """Read the input file and return the map as a list of strings."""
     try:
@@ -8,43 +11,74 @@ def read_input(filename="input.txt"):
         exit(1)
 
 
-def find_guard_start(grid):
-    """Find the guard's starting position and direction."""
-    for y in range(len(grid)):
-        for x in range(len(grid[0])):
-            if grid[y][x] == "^":
-                return x, y, "up"
-            elif grid[y][x] == ">":
-                return x, y, "right"
-            elif grid[y][x] == "v":
-                return x, y, "down"
-            elif grid[y][x] == "<":
-                return x, y, "left"
-    return None
+# Direction codes in clockwise order, so turning right is the next code
+UP, RIGHT, DOWN, LEFT = range(4)
+STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+GUARD_DIRECTIONS = {"^": UP, ">": RIGHT, "v": DOWN, "<": LEFT}
 
 
-def get_next_position(x, y, direction):
-    """Get the next position based on current direction."""
-    if direction == "up":
-        return x, y - 1
-    elif direction == "right":
-        return x + 1, y
-    elif direction == "down":
-        return x, y + 1
-    else:  # left
-        return x - 1, y
+def find_guard_start(grid):
+    """Find the guard's starting position and direction code."""
+    for y, row in enumerate(grid):
+        for x, cell in enumerate(row):
+            if cell in GUARD_DIRECTIONS:
+                return x, y, GUARD_DIRECTIONS[cell]
+    return None
 
 
 def turn_right(direction):
-    """Return the new direction after turning right."""
-    directions = ["up", "right", "down", "left"]
-    current_index = directions.index(direction)
-    return directions[(current_index + 1) % 4]
-
-
-def is_valid_position(x, y, grid):
-    """Check if position is within grid bounds."""
-    return 0 <= y < len(grid) and 0 <= x < len(grid[0])
+    """Return the new direction code after turning right."""
+    return (direction + 1) % 4
+
+
+class ObstacleIndex:
+    """Sorted obstacle positions per row and per column of the map."""
+
+    def __init__(self, grid):
+        self.height = len(grid)
+        self.width = len(grid[0]) if grid else 0
+        self.rows = [[] for _ in range(self.height)]  # obstacle x's per row
+        self.columns = [[] for _ in range(self.width)]  # obstacle y's per column
+        for y, row in enumerate(grid):
+            for x, cell in enumerate(row):
+                if cell == "#":
+                    self.rows[y].append(x)
+                    self.columns[x].append(y)
+
+    def next_stop(self, x, y, direction, extra=None):
+        """Where the guard stops walking straight from (x, y).
+
+        Returns (x, y, leaves): the cell just before the next obstacle, or
+        the last cell on the map with leaves=True if there is no obstacle
+        ahead. extra is an optional additional (x, y) obstacle.
+        """
+        if direction == UP:
+            column = self.columns[x]
+            i = bisect_left(column, y) - 1
+            stop = column[i] if i >= 0 else -1
+            if extra and extra[0] == x and stop < extra[1] < y:
+                stop = extra[1]
+            return x, stop + 1, stop < 0
+        if direction == DOWN:
+            column = self.columns[x]
+            i = bisect_right(column, y)
+            stop = column[i] if i < len(column) else self.height
+            if extra and extra[0] == x and y < extra[1] < stop:
+                stop = extra[1]
+            return x, stop - 1, stop == self.height
+        if direction == LEFT:
+            row = self.rows[y]
+            i = bisect_left(row, x) - 1
+            stop = row[i] if i >= 0 else -1
+            if extra and extra[1] == y and stop < extra[0] < x:
+                stop = extra[0]
+            return stop + 1, y, stop < 0
+        row = self.rows[y]
+        i = bisect_right(row, x)
+        stop = row[i] if i < len(row) else self.width
+        if extra and extra[1] == y and x < extra[0] < stop:
+            stop = extra[0]
+        return stop - 1, y, stop == self.width
 
 
 def simulate_guard_path(grid):
@@ -54,38 +88,34 @@ def simulate_guard_path(grid):
     if not start:
         return set()
 
+    obstacles = ObstacleIndex(grid)
     x, y, direction = start
     visited = {(x, y)}  # Set of visited positions
 
     while True:
-        # Get position in front
-        next_x, next_y = get_next_position(x, y, direction)
+        # Jump straight to the cell before the next obstacle
+        stop_x, stop_y, leaves = obstacles.next_stop(x, y, direction)
+        dx, dy = STEPS[direction]
+        for _ in range(abs(stop_x - x) + abs(stop_y - y)):
+            x, y = x + dx, y + dy
+            visited.add((x, y))
 
-        # Check if guard would leave the area
-        if not is_valid_position(next_x, next_y, grid):
+        # Check if guard left the area
+        if leaves:
             break
-
-        # Check if there's an obstacle in front
-        if grid[next_y][next_x] == "#":
-            # Turn right
-            direction = turn_right(direction)
-        else:
-            # Move forward
-            x, y = next_x, next_y
-            visited.add((x, y))
+        direction = turn_right(direction)
 
     return visited
 
 
-def main():
-    # Read input
-    grid = read_input("day6/input.txt")
+def solve(filename):
+    """Solve part 1 for the given input file."""
+    return len(simulate_guard_path(read_input(filename)))
 
-    # Simulate guard's path
-    visited = simulate_guard_path(grid)
 
+def main():
     # Print only the count of distinct positions
-    print(len(visited))
+    print(solve("day6/input.txt"))
 
 
 if __name__ == "__main__":
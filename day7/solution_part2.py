@@ -58,12 +58,14 @@ def calculate_total_calibration(equations):
     return total
 
 
-def main():
-    # Read input
-    equations = read_input("day7/input.txt")
+def solve(filename):
+    """Solve part 2 for the given input file."""
+    return calculate_total_calibration(read_input(filename))
+
 
+def main():
     # Calculate and print result
-    result = calculate_total_calibration(equations)
+    result = solve("day7/input.txt")
     print(result)
 
 
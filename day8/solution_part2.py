@@ -1,5 +1,15 @@
+import logging
+import os
+import sys
 from collections import defaultdict
 
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.log import configure  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
 # Global grid dimensions
 GRID_WIDTH = 0
 GRID_HEIGHT = 0
@@ -23,7 +33,7 @@ def find_antennas(grid):
             char = grid[y][x]
             if char != ".":
                 antennas[char].append((x, y))
-                print(f"Added antenna {char} at ({x}, {y})")
+                logger.debug("Added antenna %s at (%d, %d)", char, x, y)
     return antennas
 
 
@@ -85,8 +95,14 @@ def find_antinodes(antenna_pair):
     # Get direction vector
     direction = get_direction(antenna1, antenna2)
     dx, dy = direction
-    print(
-        f"Found direction vector ({dx}, {dy}) between antennas at ({x1}, {y1}) and ({x2}, {y2})"
+    logger.debug(
+        "Found direction vector (%d, %d) between antennas at (%d, %d) and (%d, %d)",
+        dx,
+        dy,
+        x1,
+        y1,
+        x2,
+        y2,
     )
 
     antinodes = set()
@@ -130,25 +146,25 @@ def find_all_antinodes(grid):
     global GRID_WIDTH, GRID_HEIGHT
     GRID_HEIGHT = len(grid)
     GRID_WIDTH = len(grid[0])
-    print(f"Grid dimensions: {GRID_WIDTH}x{GRID_HEIGHT}")
+    logger.debug("Grid dimensions: %dx%d", GRID_WIDTH, GRID_HEIGHT)
 
     antennas = find_antennas(grid)
-    print("\nFound antennas:", antennas)
+    logger.debug("Found antennas: %s", antennas)
     all_antinodes = set()
 
     # For each frequency
     for freq, positions in antennas.items():
-        print(f"\nChecking frequency {freq} with {len(positions)} antennas")
+        logger.debug("Checking frequency %s with %d antennas", freq, len(positions))
         # For each pair of antennas with the same frequency
         for i in range(len(positions)):
-            print(f"Checking antenna {i} of {len(positions)}")
+            logger.debug("Checking antenna %d of %d", i, len(positions))
             for j in range(i + 1, len(positions)):
-                print(f"Checking pair {i},{j}")
+                logger.debug("Checking pair %d,%d", i, j)
                 # Create antenna pair and find its antinodes
                 antenna_pair = (positions[i], positions[j])
                 antinodes = find_antinodes(antenna_pair)
                 if antinodes:
-                    print(f"Found {len(antinodes)} antinodes for this pair")
+                    logger.debug("Found %d antinodes for this pair", len(antinodes))
                 all_antinodes.update(antinodes)
 
     return all_antinodes
@@ -168,12 +184,18 @@ def create_visualization(grid, antinodes, antennas):
     return ["".join(row) for row in viz_grid]
 
 
+def solve(filename):
+    """Solve part 2 for the given input file."""
+    return len(find_all_antinodes(read_input(filename)))
+
+
 def main():
+    configure()
+
     # Read input
     grid = read_input("day8/input.txt")
-    print("Read input grid:")
-    for row in grid:
-        print(row)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Read input grid:\n%s", "\n".join(grid))
 
     # Find all antinodes
     antinodes = find_all_antinodes(grid)
@@ -4,7 +4,7 @@ from collections import deque
 def read_input(filename="input.txt"):
     """Read the disk map from input file."""
     try:
-        with open(f"day9/{filename}", "r") as file:
+        with open(filename, "r") as file:
             return file.read().strip()
     except FileNotFoundError:
         print(f"Error: {filename} not found.")
@@ -74,10 +74,16 @@ def calculate_checksum(blocks):
     return sum(pos * block_id for pos, block_id in enumerate(blocks) if block_id != ".")
 
 
+def solve(filename):
+    """Solve part 1 for the given input file."""
+    blocks = create_block_representation(parse_disk_map(read_input(filename)))
+    return calculate_checksum(compact_files_optimized(blocks))
+
+
 def main():
     # Process actual input directly
     print("Processing input...")
-    disk_map = read_input("input.txt")
+    disk_map = read_input("day9/input.txt")
     print(f"Input disk map length: {len(disk_map)}")
 
     sections = parse_disk_map(disk_map)
@@ -1,7 +1,7 @@
 def read_input(filename="input.txt"):
     """Read the disk map from input file."""
     try:
-        with open(f"day9/{filename}", "r") as file:
+        with open(filename, "r") as file:
             return file.read().strip()
     except FileNotFoundError:
         print(f"Error: {filename} not found.")
@@ -78,10 +78,17 @@ def calculate_checksum(blocks):
     return checksum
 
 
+def solve(filename):
+    """Solve part 2 for the given input file."""
+    sections = parse_disk_map(read_input(filename))
+    blocks, file_info = create_block_representation(sections)
+    return calculate_checksum(compact_files_optimized(blocks, file_info))
+
+
 def main():
     # Process input
     print("Processing input...")
-    disk_map = read_input("input.txt")
+    disk_map = read_input("day9/input.txt")
     print(f"Input disk map length: {len(disk_map)}")
 
     sections = parse_disk_map(disk_map)